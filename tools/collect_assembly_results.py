@@ -7,26 +7,104 @@ It processes multiple output files and combines them for analysis.
 """
 
 import argparse
+import os
 import sys
 import re
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import logging
 
+# Import the msg parser (it may be on the path already or next to this script in tools/)
+try:
+    from scale_msg_parser import ScaleMsgParser
+except ImportError:
+    tools_dir = Path(__file__).parent
+    if str(tools_dir) not in sys.path:
+        sys.path.insert(0, str(tools_dir))
+    from scale_msg_parser import ScaleMsgParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speedup; falls back to stdlib json
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# SCALE output is plain ASCII, so patterns run on raw bytes and only captured groups are decoded
+# Fallback status keywords; group 1 marks a normal termination, which wins over any error keyword
+_STATUS_RE = re.compile(rb'(normally terminated)|error|failed', re.IGNORECASE)
+_ELEMENT_CASE_RE = re.compile(rb'case\(element_\d+_burn\)')
+_ELAPSED_TIME_RE = re.compile(rb'elapsed time:\s*(\d+\.?\d*)\s*seconds', re.IGNORECASE)
+_ISOTOPE_MASS_RE = re.compile(rb'(\w+\d+)\s+([\d\.E\-\+]+)\s+grams')
+
+_ELEMENT_FILENAME_RE = re.compile(r'element_(.+)_G(\d+)\.out')
+
+# Status and final isotope tables live at the end of SCALE output; fast mode only scans this much
+_FAST_TAIL_BYTES = 64 * 1024
+
+def _list_outputs(directory: Union[str, Path], prefix: str) -> List[os.DirEntry]:
+    """List '<prefix>*.out' files with a single scandir pass (entries cache their stat)"""
+    with os.scandir(directory) as it:
+        return [e for e in it if e.name.startswith(prefix) and e.name.endswith('.out')]
+
+def _read_bytes(path: Union[Path, os.DirEntry], tail: Optional[int] = None) -> Optional[bytes]:
+    """Read a file (or only its last `tail` bytes), returning None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            if tail is not None:
+                f.seek(max(0, f.seek(0, os.SEEK_END) - tail))
+            return f.read()
+    except OSError:
+        return None
+
+def _prefetch_contents(paths: List, depth: int, tail: Optional[int] = None):
+    """
+    Yield (path, content) pairs in order while keeping up to `depth` reads in flight
+    
+    Overlaps per-file open/read latency on networked filesystems; memory is bounded
+    to `depth` file contents at a time. A depth below 2 reads lazily in the caller.
+    """
+    if depth < 2:
+        for path in paths:
+            yield path, None
+        return
+    
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        pending = deque((path, pool.submit(_read_bytes, path, tail)) for path in islice(paths, depth))
+        while pending:
+            path, future = pending.popleft()
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append((next_path, pool.submit(_read_bytes, next_path, tail)))
+            yield path, future.result()
+
+def _dumps_indented(obj, level: int) -> str:
+    """Serialize obj as 2-space indented JSON nested `level` deep inside an enclosing document"""
+    if orjson is not None:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    else:
+        text = json.dumps(obj, indent=2)
+    return text.replace('\n', '\n' + '  ' * level)
+
 class ScaleResultsCollector:
     """Collect and aggregate results from parallel SCALE runs (assembly or element-based)"""
     
-    def __init__(self, mode: str = 'assembly'):
+    def __init__(self, mode: str = 'assembly', read_ahead: int = 8, fast: bool = False):
         self.mode = mode  # 'assembly' or 'element'
+        self.read_ahead = read_ahead  # Output files read concurrently ahead of the parser
+        self.fast = fast  # Element mode only: scan just the tail of each output file
         self.assembly_results = {}  # Dict of assembly_name: results
         self.element_results = {}   # Dict of element_filename: results
         self.element_mapping = None # Element to assembly mapping
+        self._fast_map = {}         # filename -> (assembly, element_key, element_number, safe_assembly)
+        self._msg_parser = None     # Shared ScaleMsgParser, created on first use
         self.total_elements = 0
         self.successful_assemblies = 0
         self.failed_assemblies = 0
@@ -38,6 +116,8 @@ class ScaleResultsCollector:
         mapping_file = Path(input_dir) / "element_mapping.json"
         if mapping_file.exists():
             try:
+                if orjson is not None:
+                    return orjson.loads(mapping_file.read_bytes())
                 with open(mapping_file, 'r') as f:
                     return json.load(f)
             except Exception as e:
@@ -56,16 +136,25 @@ class ScaleResultsCollector:
             self.element_mapping = self.load_element_mapping(input_dir)
             if self.element_mapping:
                 logger.info(f"Loaded element mapping with {len(self.element_mapping)} elements")
+                self._fast_map = {}
+                for filename, m in self.element_mapping.items():
+                    try:
+                        self._fast_map[filename] = (sys.intern(m['assembly']), m['element_key'],
+                                                    m['element_number'], m['safe_assembly'])
+                    except (KeyError, TypeError) as e:
+                        # Left out: the file's info is parsed from its name instead
+                        logger.warning(f"Skipping malformed element mapping entry for {filename}: {e!r}")
         
         # Find output files based on mode
         if self.mode == 'element':
-            pattern = "element_*.out"
+            prefix = "element_"
             job_type = "element"
         else:
-            pattern = "assembly_*.out"
+            prefix = "assembly_"
             job_type = "assembly"
+        pattern = f"{prefix}*.out"
             
-        output_files = list(input_path.glob(pattern))
+        output_files = _list_outputs(input_path, prefix)
         if not output_files:
             logger.error(f"No {job_type} output files found in {input_dir} (pattern: {pattern})")
             return False
@@ -90,43 +179,53 @@ class ScaleResultsCollector:
         match = re.match(r'assembly_(.+)\.out', filename)
         if match:
             safe_name = match.group(1)
-            # Convert safe filename back to original name (decode in correct order)
-            return safe_name.replace('_SLASH_', '/').replace('__', ' ')
+            # Convert safe filename back to original name (decode in correct order);
+            # interned so every result referencing the assembly shares one string
+            return sys.intern(safe_name.replace('_SLASH_', '/').replace('__', ' '))
         return filename
         
     def extract_element_info(self, filename: str) -> Dict:
         """Extract element information from element output filename"""
         # Extract info from "element_Assembly__MTR-F-001_G001.out" or similar
-        if self.element_mapping and filename in self.element_mapping:
-            mapping = self.element_mapping[filename]
+        mapped = self._fast_map.get(filename)
+        if mapped is not None:
+            assembly, element_key, element_number, safe_assembly = mapped
             return {
-                'assembly': mapping['assembly'],
-                'element_key': mapping['element_key'],
-                'element_number': mapping['element_number'],
-                'safe_assembly': mapping['safe_assembly']
+                'assembly': assembly,
+                'element_key': element_key,
+                'element_number': element_number,
+                'safe_assembly': safe_assembly
             }
         else:
             # Fallback parsing from filename (G = global element number)
-            match = re.match(r'element_(.+)_G(\d+)\.out', filename)
-            if match:
-                safe_assembly = match.group(1)
-                element_number = int(match.group(2))
+            safe_assembly, number = None, None
+            if filename.startswith('element_') and filename.endswith('.out'):
+                safe_assembly, sep, number = filename[8:-4].rpartition('_G')
+                if not (sep and safe_assembly and number.isdigit()):
+                    safe_assembly = None
+            if safe_assembly is None:
+                match = _ELEMENT_FILENAME_RE.match(filename)
+                if match:
+                    safe_assembly, number = match.groups()
+            if safe_assembly is not None:
+                element_number = int(number)
                 return {
-                    'assembly': safe_assembly.replace('_SLASH_', '/').replace('__', ' '),
+                    'assembly': sys.intern(safe_assembly.replace('_SLASH_', '/').replace('__', ' ')),
                     'element_key': f'Element #{element_number}',
                     'element_number': element_number,
                     'safe_assembly': safe_assembly
                 }
             return {'assembly': 'Unknown', 'element_key': filename, 'element_number': 0, 'safe_assembly': 'unknown'}
     
-    def collect_assembly_results(self, output_files: List[Path]) -> bool:
+    def collect_assembly_results(self, output_files: List[os.DirEntry]) -> bool:
         """Collect results from assembly output files"""
-        for output_file_path in sorted(output_files):
+        ordered_files = sorted(output_files, key=lambda e: e.name)
+        for output_file_path, content in _prefetch_contents(ordered_files, self.read_ahead):
             assembly_name = self.extract_assembly_name(output_file_path.name)
             logger.debug(f"Processing {assembly_name}: {output_file_path}")
             
             try:
-                result = self.parse_job_output(output_file_path, job_type='assembly')
+                result = self.parse_job_output(output_file_path, job_type='assembly', content=content)
                 if result:
                     self.assembly_results[assembly_name] = result
                     self.successful_assemblies += 1
@@ -141,27 +240,35 @@ class ScaleResultsCollector:
         
         return True
         
-    def collect_element_results(self, output_files: List[Path]) -> bool:
+    def collect_element_results(self, output_files: List[os.DirEntry]) -> bool:
         """Collect results from element output files and group by assembly"""
-        # Group elements by assembly for summary
-        assembly_elements = defaultdict(list)
+        # Group elements by assembly, aggregating the summary counters as results arrive
+        assembly_elements = defaultdict(lambda: {'count': 0, 'ok': 0, 'fail': 0, 'time': 0, 'elements': {}})
         
-        for output_file_path in sorted(output_files):
+        ordered_files = sorted(output_files, key=lambda e: e.name)
+        tail = _FAST_TAIL_BYTES if self.fast else None
+        for output_file_path, content in _prefetch_contents(ordered_files, self.read_ahead, tail):
             element_filename = output_file_path.name
             logger.debug(f"Processing element: {element_filename}")
             
             try:
-                result = self.parse_job_output(output_file_path, job_type='element')
+                result = self.parse_job_output(output_file_path, job_type='element', content=content,
+                                               fast=self.fast)
                 if result:
                     self.element_results[element_filename] = result
                     self.successful_elements += 1
                     
                     # Group by assembly if mapping is available
-                    if self.element_mapping and element_filename in self.element_mapping:
-                        assembly_name = self.element_mapping[element_filename]['assembly']
-                        assembly_elements[assembly_name].append((element_filename, result))
+                    mapped = self._fast_map.get(element_filename)
+                    assembly_name = mapped[0] if mapped is not None else "Ungrouped"
+                    group = assembly_elements[assembly_name]
+                    group['count'] += 1
+                    if result['execution_status'] == 'completed':
+                        group['ok'] += 1
                     else:
-                        assembly_elements["Ungrouped"].append((element_filename, result))
+                        group['fail'] += 1
+                    group['time'] += result.get('execution_time', 0) or 0
+                    group['elements'][element_filename] = result
                 else:
                     logger.warning(f"Failed to parse results from {element_filename}")
                     self.failed_elements += 1
@@ -171,18 +278,15 @@ class ScaleResultsCollector:
                 self.failed_elements += 1
         
         # Create assembly summaries from element results
-        for assembly_name, elements in assembly_elements.items():
-            successful_elements = [elem for filename, elem in elements if elem['execution_status'] == 'completed']
-            failed_elements = [elem for filename, elem in elements if elem['execution_status'] != 'completed']
-            
+        for assembly_name, group in assembly_elements.items():
             assembly_summary = {
                 'assembly_name': assembly_name,
-                'element_count': len(elements),
-                'successful_elements': len(successful_elements),
-                'failed_elements': len(failed_elements),
-                'execution_status': 'completed' if len(failed_elements) == 0 else 'partial' if len(successful_elements) > 0 else 'failed',
-                'total_execution_time': sum(elem.get('execution_time', 0) or 0 for filename, elem in elements),
-                'elements': {filename: result for filename, result in elements}
+                'element_count': group['count'],
+                'successful_elements': group['ok'],
+                'failed_elements': group['fail'],
+                'execution_status': 'completed' if group['fail'] == 0 else 'partial' if group['ok'] > 0 else 'failed',
+                'total_execution_time': group['time'],
+                'elements': group['elements']
             }
             
             self.assembly_results[assembly_name] = assembly_summary
@@ -194,19 +298,29 @@ class ScaleResultsCollector:
         self.total_elements = len(output_files)
         return True
     
-    def parse_job_output(self, file_path: Path, job_type: str = 'assembly') -> Optional[Dict]:
-        """Parse a single assembly output file and corresponding .msg file for key results"""
+    def parse_job_output(self, file_path: Union[Path, os.DirEntry], job_type: str = 'assembly',
+                         content: Optional[bytes] = None, fast: bool = False) -> Optional[Dict]:
+        """Parse a single assembly output file and corresponding .msg file for key results
+        
+        `content` may carry the file's bytes when they were already read ahead. With
+        `fast`, only the last 64 KB (status and final isotopes) are scanned, so the
+        assembly-mode element count is not available.
+        """
         try:
-            # Import the msg parser (it may be in the same directory or in tools/)
-            try:
-                from scale_msg_parser import ScaleMsgParser
-            except ImportError:
-                # Try importing from the same directory as this script
-                import sys
-                sys.path.append(str(file_path.parent))
-                from scale_msg_parser import ScaleMsgParser
+            if self._msg_parser is None:
+                self._msg_parser = ScaleMsgParser()
+            msg_parser = self._msg_parser
             
-            msg_parser = ScaleMsgParser()
+            # Stat each path once up front; every extra exists()/stat() is a
+            # round trip on the networked filesystems SCALE results live on
+            try:
+                if isinstance(file_path, os.DirEntry):
+                    file_size = file_path.stat().st_size
+                else:
+                    file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                file_size = None
+            file_path = Path(file_path)
             
             if job_type == 'element':
                 element_info = self.extract_element_info(file_path.name)
@@ -216,7 +330,7 @@ class ScaleResultsCollector:
                     'element_key': element_info['element_key'],
                     'element_number': element_info['element_number'],
                     'file_path': str(file_path),
-                    'file_size_mb': file_path.stat().st_size / (1024 * 1024),
+                    'file_size_mb': (file_size or 0) / (1024 * 1024),
                     'execution_status': 'unknown',
                     'total_mass_g': {},
                     'final_isotopes': {},
@@ -229,7 +343,7 @@ class ScaleResultsCollector:
                 result = {
                     'assembly_name': self.extract_assembly_name(file_path.name),
                     'file_path': str(file_path),
-                    'file_size_mb': file_path.stat().st_size / (1024 * 1024),
+                    'file_size_mb': (file_size or 0) / (1024 * 1024),
                     'element_count': 0,
                     'execution_status': 'unknown',
                     'total_mass_g': {},
@@ -242,9 +356,13 @@ class ScaleResultsCollector:
             
             # First check the .msg file for execution status
             msg_file = file_path.with_suffix('.msg')
-            if msg_file.exists():
+            try:
+                msg_st = os.stat(msg_file)
+            except FileNotFoundError:
+                msg_st = None
+            if msg_st is not None:
                 try:
-                    msg_data = msg_parser.parse_msg_file(msg_file)
+                    msg_data = msg_parser.parse_msg_file(msg_file, stat=msg_st)
                     result.update({
                         'execution_status': msg_data['status'],
                         'return_code': msg_data.get('return_code'),
@@ -256,41 +374,44 @@ class ScaleResultsCollector:
                     logger.debug(f"Could not parse .msg file {msg_file}: {e}")
             
             # Parse the output file if it exists
-            if not file_path.exists():
+            if file_size is None:
                 result['execution_status'] = 'not_started'
                 return result
             
-            with open(file_path, 'r') as f:
-                content = f.read()
+            if content is None:
+                with open(file_path, 'rb') as f:
+                    if fast:
+                        f.seek(max(0, file_size - _FAST_TAIL_BYTES))
+                    content = f.read()
+            elif fast:
+                content = content[-_FAST_TAIL_BYTES:]
             
             # Fallback status check if .msg file wasn't available or parsed
             if result['execution_status'] == 'unknown':
-                if "normally terminated" in content.lower():
-                    result['execution_status'] = 'completed'
-                elif "error" in content.lower() or "failed" in content.lower():
+                for match in _STATUS_RE.finditer(content):
+                    if match.group(1):
+                        result['execution_status'] = 'completed'
+                        break
                     result['execution_status'] = 'failed'
-                else:
-                    result['execution_status'] = 'unknown'
             
             # Count elements processed (only for assembly mode)
             if job_type == 'assembly':
-                element_matches = re.findall(r'case\(element_\d+_burn\)', content)
+                element_matches = _ELEMENT_CASE_RE.findall(content)
                 result['element_count'] = len(element_matches)
             else:
                 result['element_count'] = 1  # Single element per file
             
             # Extract execution time from output file if not available from .msg
             if result['execution_time'] is None:
-                time_match = re.search(r'elapsed time:\s*(\d+\.?\d*)\s*seconds', content, re.IGNORECASE)
+                time_match = _ELAPSED_TIME_RE.search(content)
                 if time_match:
                     result['execution_time'] = float(time_match.group(1))
             
             # Parse final isotope concentrations (simplified extraction)
             # This would need to be customized based on SCALE output format
-            isotope_pattern = r'(\w+\d+)\s+([\d\.E\-\+]+)\s+grams'
-            isotope_matches = re.findall(isotope_pattern, content)
+            isotope_matches = _ISOTOPE_MASS_RE.findall(content)
             for isotope, mass in isotope_matches[-50:]:  # Take last 50 as final values
-                result['final_isotopes'][isotope] = float(mass)
+                result['final_isotopes'][isotope.decode('ascii')] = float(mass)
             
             # Calculate total mass
             if result['final_isotopes']:
@@ -303,32 +424,42 @@ class ScaleResultsCollector:
             return None
     
     def save_combined_results(self, output_file: str):
-        """Save combined results to JSON file"""
+        """Save combined results to JSON file
+        
+        The document is streamed one result at a time so peak memory stays at
+        the size of a single result rather than the whole serialized file.
+        """
         try:
-            combined_data = {
-                'summary': {
-                    'mode': self.mode,
-                    'total_assemblies': len(self.assembly_results),
-                    'successful_assemblies': self.successful_assemblies,
-                    'failed_assemblies': self.failed_assemblies,
-                    'total_elements': self.total_elements,
-                    'collection_timestamp': str(Path().cwd()),
-                },
-                'assembly_results': self.assembly_results
+            summary = {
+                'mode': self.mode,
+                'total_assemblies': len(self.assembly_results),
+                'successful_assemblies': self.successful_assemblies,
+                'failed_assemblies': self.failed_assemblies,
+                'total_elements': self.total_elements,
+                'collection_timestamp': str(Path().cwd()),
             }
+            sections = [('assembly_results', self.assembly_results)]
             
             if self.mode == 'element':
-                combined_data['summary'].update({
+                summary.update({
                     'total_element_files': len(self.element_results),
                     'successful_elements': self.successful_elements,
                     'failed_elements': self.failed_elements
                 })
-                combined_data['element_results'] = self.element_results
+                sections.append(('element_results', self.element_results))
                 if self.element_mapping:
-                    combined_data['element_mapping'] = self.element_mapping
+                    sections.append(('element_mapping', self.element_mapping))
             
-            with open(output_file, 'w') as f:
-                json.dump(combined_data, f, indent=2)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write('{\n  "summary": ' + _dumps_indented(summary, 1))
+                for section_name, section in sections:
+                    f.write(f',\n  "{section_name}": {{')
+                    separator = '\n    '
+                    for key, value in section.items():
+                        f.write(f'{separator}{json.dumps(str(key))}: {_dumps_indented(value, 2)}')
+                        separator = ',\n    '
+                    f.write('\n  }' if section else '}')
+                f.write('\n}')
             
             logger.info(f"Combined results saved to: {output_file}")
             
@@ -451,6 +582,13 @@ Examples:
     parser.add_argument("--check-msg", action="store_true",
                         help="Use .msg files for accurate completion status (recommended)")
     
+    parser.add_argument("--read-ahead", type=int, default=8,
+                        help="Number of output files read concurrently ahead of parsing; raise it on "
+                             "high-latency filesystems such as NFS (0 disables, default: 8)")
+    
+    parser.add_argument("--fast", action="store_true",
+                        help="Element mode: scan only the last 64 KB of each output for status and isotopes")
+    
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Enable verbose logging")
     
@@ -468,9 +606,8 @@ Examples:
     # Auto-detect mode if requested
     mode = args.mode
     if mode == 'auto':
-        input_path = Path(args.input_dir)
-        element_files = list(input_path.glob("element_*.out"))
-        assembly_files = list(input_path.glob("assembly_*.out"))
+        element_files = _list_outputs(args.input_dir, "element_")
+        assembly_files = _list_outputs(args.input_dir, "assembly_")
         
         if element_files and not assembly_files:
             mode = 'element'
@@ -487,7 +624,7 @@ Examples:
     
     # Collect results
     try:
-        collector = ScaleResultsCollector(mode=mode)
+        collector = ScaleResultsCollector(mode=mode, read_ahead=args.read_ahead, fast=args.fast)
         
         if not collector.collect_results(args.input_dir, args.output):
             logger.error(f"Failed to collect {mode} results")
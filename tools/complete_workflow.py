@@ -29,53 +29,299 @@ Usage:
 """
 
 import os
+import re
 import sys
 import time
+import queue
+import atexit
+import asyncio
 import shutil
 import subprocess
 import logging
+import logging.handlers
+import signal
 import argparse
+import functools
+import mmap
+import sqlite3
+import zipfile
+import zlib
+from collections import deque
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import json
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # Optional: lets the MCNP summary be streamed instead of fully loaded
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speedup; falls back to stdlib json
+
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 logger = logging.getLogger(__name__)
 
+# ORIGEN cards header comments carrying the covered date range
+_DATE_RANGE_RE = re.compile(r'# Date range: (.+?) to (.+?)$')
+_START_DATE_RE = re.compile(r'# Start date: (.+?)$')
+_END_DATE_RE = re.compile(r'# End date: (.+?)$')
+
+# "Label: value" statistics printed by the ORIGEN generation and verification scripts
+_ORIGEN_STAT_RE = re.compile(r'(Total entries|Shutdown periods|Power periods|Date range):[ \t]*(.*?)[ \t\r]*$', re.M)
+_ORIGEN_STAT_KEYS = {
+    'Total entries': 'origen_total_entries',
+    'Shutdown periods': 'origen_shutdown_periods',
+    'Power periods': 'origen_power_periods',
+    'Date range': 'origen_date_range',
+}
+_VERIFY_STAT_RE = re.compile(r'(Total entries verified|Power discrepancies|Time discrepancies):[ \t]*(.*?)[ \t\r]*$', re.M)
+_VERIFY_STAT_KEYS = {
+    'Total entries verified': 'verification_total_entries',
+    'Power discrepancies': 'verification_power_discrepancies',
+    'Time discrepancies': 'verification_time_discrepancies',
+}
+# Job totals printed by scale_parallel_runner.py, scanned from its stdout log
+_SCALE_JOBS_RE = re.compile(rb'(Successful|Failed):[ \t]*(\d+)')
+
+_BAR = "=" * 80
+
+# Archiving: files above this size are streamed by zipfile; smaller ones are read and
+# compressed ahead by worker threads, with at most this many bytes read ahead
+_ARCHIVE_STREAM_SIZE = 64 * 1024 * 1024
+_ARCHIVE_READ_AHEAD_BYTES = 256 * 1024 * 1024
+
+def _scan_files(dir_path: Path, suffix: str, sample_size: int = 16) -> Tuple[int, List[str]]:
+    """Count files ending in `suffix` with one scandir pass, keeping the first few paths as a sample"""
+    count = 0
+    sample = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.name.endswith(suffix):
+                if count < sample_size:
+                    sample.append(str(dir_path / entry.name))
+                count += 1
+    return count, sample
+
+@functools.lru_cache(maxsize=64)
+def _resolve_exe(exe_path: str) -> Optional[str]:
+    """Resolve an executable by path or PATH lookup, caching the answer across stage retries"""
+    return exe_path if Path(exe_path).exists() else shutil.which(exe_path)
+
+def _scan_log(log_path: Path, pattern: 're.Pattern[bytes]') -> List[Tuple[bytes, ...]]:
+    """Run a bytes regex over a log file through mmap, returning the groups of each match"""
+    with open(log_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [match.groups() for match in pattern.finditer(mm)]
+
+def _read_log_tail(log_path: Path, size: int = 16384) -> str:
+    """Return the last `size` bytes of a log file as text (for error messages)"""
+    with open(log_path, 'rb') as f:
+        f.seek(max(0, f.seek(0, os.SEEK_END) - size))
+        return f.read().decode('utf-8', errors='replace')
+
+def _load_processing_info(summary_path: Path) -> Dict:
+    """Read only the 'processing_info' block of an MCNP processing summary ({} if it is missing)"""
+    try:
+        with open(summary_path, 'rb') as f:
+            if ijson is not None:
+                return next(ijson.items(f, 'processing_info', use_float=True), None) or {}
+            return json.load(f).get('processing_info', {})
+    except FileNotFoundError:
+        return {}
+
+def _fast_move(src: Path, dst: Path) -> None:
+    """
+    Move a file, atomically with os.replace when src and dst share a filesystem
+    
+    Cross-device moves copy with os.sendfile (kernel-side, where available) or an
+    8 MB buffered copy, then remove the source like shutil.move would.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        logger.warning(f"os.replace() failed, copying instead: {e}")
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=8 << 20)
+    shutil.copystat(src, dst)
+    os.unlink(src)
+
+def _optimize_materials_db(db_path: Path) -> None:
+    """
+    Repack the MCNP materials database and switch it to WAL journaling
+    
+    WAL is persistent in the file, so downstream tools can read the database
+    concurrently without blocking on the rollback journal.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('VACUUM')
+        conn.execute('PRAGMA journal_mode=WAL')
+    finally:
+        conn.close()
+
+def _walk_files(root, prefix: str = '') -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, archive name) for every file under root, recursing with os.scandir"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, f"{prefix}{entry.name}/")
+            elif entry.is_file():
+                yield entry, prefix + entry.name
+
+def _pack_file(entry: os.DirEntry, arcname: str, compression: int) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Read and (for ZIP_DEFLATED) raw-deflate one file at level 1, returning its filled-in ZipInfo"""
+    st = entry.stat()
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[0:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.compress_type = compression
+    with open(entry.path, 'rb') as f:
+        data = f.read()
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    if compression == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(1, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+def _write_packed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes) -> None:
+    """Append an entry whose payload was already compressed by _pack_file"""
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    # Sizes and CRC are known up front, so the local header is final and needs no data descriptor
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.write(data)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+
+def _archive_directory(files: Iterable[Tuple[os.DirEntry, str]], zip_path: Path,
+                       compression: int = zipfile.ZIP_DEFLATED, remove: frozenset = frozenset(),
+                       workers: int = 4) -> int:
+    """
+    Zip (entry, archive name) pairs from _walk_files, returning the number of files archived
+    
+    Files up to _ARCHIVE_STREAM_SIZE are read and deflated (level 1, about twice as
+    fast as the default level) by `workers` threads, since zlib releases the GIL,
+    while entries are written in walk order. Read-ahead stops at 2 x workers files or
+    _ARCHIVE_READ_AHEAD_BYTES of file data, whichever comes first. Larger files are
+    streamed by ZipFile.write when their turn comes, so they are never held in memory.
+    Files whose archive names are listed in `remove` are unlinked once the archive
+    has been closed, so an interrupted run never loses originals to an unreadable zip.
+    """
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    files = iter(files)
+    max_pending = 2 * max(1, workers)
+    count = 0
+    to_remove = []
+    with zipfile.ZipFile(zip_path, 'w', compression=compression, allowZip64=True, compresslevel=1) as zf, \
+            ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending = deque()  # (entry, arcname, bytes read ahead, future; None for a streamed file)
+        pending_bytes = 0
+        
+        def fill():
+            nonlocal pending_bytes
+            while len(pending) < max_pending and (pending_bytes < _ARCHIVE_READ_AHEAD_BYTES or not pending):
+                item = next(files, None)
+                if item is None:
+                    return
+                entry, arcname = item
+                size = entry.stat().st_size
+                if size > _ARCHIVE_STREAM_SIZE:
+                    pending.append((entry, arcname, 0, None))
+                else:
+                    pending.append((entry, arcname, size, pool.submit(_pack_file, entry, arcname, compression)))
+                    pending_bytes += size
+        
+        fill()
+        while pending:
+            entry, arcname, size, future = pending.popleft()
+            if future is None:
+                zf.write(entry.path, arcname)
+            else:
+                _write_packed(zf, *future.result())
+                pending_bytes -= size
+            fill()
+            count += 1
+            if arcname in remove:
+                to_remove.append(entry.path)
+    # The central directory is written on close; only then are the archived copies readable
+    for path in to_remove:
+        os.unlink(path)
+    return count
+
 class WorkflowStep:
     """Represents a single workflow step with status tracking"""
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
         self.status = 'pending'  # pending, running, completed, failed, skipped
-        self.start_time = None
+        self.start_time = None  # Wall-clock timestamps, for reporting only
         self.end_time = None
+        self.duration = None    # Seconds, measured with the monotonic perf counter
+        self._t0_ns = 0
         self.error_message = None
         self.output_files = []
+        self._record = None     # Results record, built once the step finishes
     
     def start(self):
         self.status = 'running'
         self.start_time = datetime.now()
+        self._t0_ns = time.perf_counter_ns()
         logger.info(f"Starting step: {self.description}")
     
+    def _stop(self):
+        self.duration = (time.perf_counter_ns() - self._t0_ns) * 1e-9
+        self.end_time = datetime.now()
+    
+    def snapshot(self) -> Dict:
+        """Results record for this step: status, duration and output files"""
+        if self._record is None:
+            self._record = {'status': self.status, 'duration': self.duration, 'output_files': self.output_files}
+        return self._record
+    
     def complete(self, output_files: List[str] = None):
         self.status = 'completed'
-        self.end_time = datetime.now()
+        self._stop()
         self.output_files = output_files or []
-        duration = (self.end_time - self.start_time).total_seconds()
-        logger.info(f"Completed step: {self.description} ({duration:.1f}s)")
+        self._record = None
+        logger.info(f"Completed step: {self.description} ({self.duration:.1f}s)")
     
     def fail(self, error_message: str):
         self.status = 'failed'
-        self.end_time = datetime.now()
+        self._stop()
         self.error_message = error_message
+        self._record = None
         logger.error(f"Failed step: {self.description} - {error_message}")
     
     def skip(self, reason: str):
         self.status = 'skipped'
+        self._record = None
         logger.info(f"Skipped step: {self.description} - {reason}")
 
 class CompleteWorkflow:
@@ -108,7 +354,7 @@ class CompleteWorkflow:
             origen_tolerance_power: Power tolerance for verification (MW)
             origen_tolerance_time: Time tolerance for verification (minutes)
         """
-        self.flux_json = Path(flux_json)
+        self.flux_json = Path(flux_json).resolve()
         self.power_time = Path(power_time) if power_time else None
         self.scale_workers = scale_workers
         self.parse_workers = parse_workers
@@ -116,7 +362,7 @@ class CompleteWorkflow:
         self.scale_command = scale_command
         
         # ORIGEN generation parameters
-        self.burnup_db = Path(burnup_db)
+        self.burnup_db = Path(burnup_db).resolve()
         self.year = year
         self.start_date = start_date
         self.end_date = end_date
@@ -125,6 +371,17 @@ class CompleteWorkflow:
         self.origen_tolerance_power = origen_tolerance_power
         self.origen_tolerance_time = origen_tolerance_time
         
+        # Date filter tail shared by the ORIGEN generation and verification commands
+        date_filter_args = []
+        if self.year:
+            date_filter_args += ['--year', str(self.year)]
+        if self.start_date:
+            date_filter_args += ['--start-date', self.start_date]
+        if self.end_date:
+            date_filter_args += ['--end-date', self.end_date]
+        date_filter_args.append('--verbose')
+        self._date_filter_args = tuple(date_filter_args)
+        
         # Generate run directory (temporarily, will be updated after date extraction)
         if run_name:
             self.run_name = run_name
@@ -136,6 +393,25 @@ class CompleteWorkflow:
         self._temp_run_name = self.run_name  # Store temporary name
         self.working_dir = Path.cwd()
         
+        # Stage scripts, resolved once relative to the repository (not the working directory)
+        repo_root = Path(__file__).resolve().parent.parent
+        self._origen_gen_script = repo_root / 'generate_origen_cards.py'
+        self._verify_script = repo_root / 'verify_origen_cards.py'
+        self._scale_input_script = repo_root / 'generate_scale_input.py'
+        self._scale_runner = repo_root / 'tools' / 'scale_parallel_runner.py'
+        self._parser_script = repo_root / 'tools' / 'parallel_parseOutput_processor.py'
+        missing_scripts = [str(script) for script in (self._origen_gen_script, self._verify_script,
+                                                      self._scale_input_script, self._scale_runner,
+                                                      self._parser_script) if not script.exists()]
+        if missing_scripts:
+            raise FileNotFoundError(f"Workflow scripts not found: {', '.join(missing_scripts)}")
+        
+        # Child process settings, built once and shared by every stage. Python opens
+        # files close-on-exec, so POSIX children can skip the close_fds walk; a new
+        # session lets an interrupted stage be killed together with its workers.
+        self._child_env = dict(os.environ)
+        self._child_popen_kwargs = {'close_fds': False, 'start_new_session': True} if os.name == 'posix' else {}
+        
         # Workflow steps
         self.steps = {
             'setup': WorkflowStep('setup', 'Setting up workflow directories'),
@@ -147,6 +423,9 @@ class CompleteWorkflow:
             'cleanup': WorkflowStep('cleanup', 'Cleaning up and archiving results')
         }
         
+        # Append-only log of results deltas, replayed on --resume-from
+        self._event_log = None
+        
         # Results tracking
         self.results = {
             'run_name': self.run_name,
@@ -192,12 +471,20 @@ class CompleteWorkflow:
                 logger.warning(f"ORIGEN cards file not found: {self.power_time}")
                 return metadata
             
+            # Date metadata lives in the comment header at the top of the file, so
+            # stop reading at the first data line instead of loading the whole file
+            date_range_match = start_match = end_match = None
             with open(self.power_time, 'r') as f:
-                content = f.read()
+                for line in f:
+                    line = line.rstrip('\n')
+                    if line and not line.startswith('#'):
+                        break
+                    date_range_match = _DATE_RANGE_RE.match(line)
+                    if date_range_match:
+                        break
+                    start_match = start_match or _START_DATE_RE.match(line)
+                    end_match = end_match or _END_DATE_RE.match(line)
             
-            # Look for date range in header comments
-            import re
-            date_range_match = re.search(r'# Date range: (.+?) to (.+?)\n', content)
             if date_range_match:
                 metadata['first_date'] = date_range_match.group(1).strip()
                 metadata['last_date'] = date_range_match.group(2).strip()
@@ -212,9 +499,6 @@ class CompleteWorkflow:
                     metadata['date_range_str'] = f"{first_year}-{last_year}"
             else:
                 # Try single date patterns
-                start_match = re.search(r'# Start date: (.+?)\n', content)
-                end_match = re.search(r'# End date: (.+?)\n', content)
-                
                 if start_match:
                     metadata['first_date'] = start_match.group(1).strip()
                     year = metadata['first_date'][:4] if len(metadata['first_date']) >= 4 else metadata['first_date']
@@ -247,17 +531,94 @@ class CompleteWorkflow:
             self.results['date_metadata'] = self.date_metadata
     
     def setup_logging(self):
-        """Setup logging configuration"""
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(f'workflow_{self.run_name}.log')
-            ]
+        """
+        Setup logging configuration
+        
+        Records are handed to a queue and written by a background listener
+        thread, so console and log-file IO never block the orchestrator.
+        """
+        root_logger = logging.getLogger()
+        if root_logger.handlers:
+            return  # Already configured (same behaviour as logging.basicConfig)
+        
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.StreamHandler(),
+            logging.FileHandler(f'workflow_{self.run_name}.log', delay=True)
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)  # Flush pending records on exit/interrupt
+        
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        root_logger.setLevel(logging.INFO)
+    
+    def _stage_log_paths(self, log_name: str) -> Tuple[Path, Path]:
+        """Paths of the stdout/stderr logs a stage writes under <run_dir>/logs"""
+        log_dir = self.run_dir / 'logs'
+        return log_dir / f'{log_name}_stdout.log', log_dir / f'{log_name}_stderr.log'
+    
+    async def _run_command(self, cmd: List[str], timeout: float, log_name: Optional[str] = None,
+                           log_stdout: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a child process without blocking the event loop, collecting stdout/stderr as text
+        
+        With `log_name`, stderr (and stdout, unless `log_stdout` is False) is written
+        straight to the stage's log files (see _stage_log_paths) instead of being
+        buffered in memory; the returned stdout/stderr are None for logged streams.
+        """
+        stdout_target = stderr_target = asyncio.subprocess.PIPE
+        if log_name:
+            stdout_path, stderr_path = self._stage_log_paths(log_name)
+            stdout_path.parent.mkdir(parents=True, exist_ok=True)
+            stderr_target = open(stderr_path, 'wb')
+            if log_stdout:
+                stdout_target = open(stdout_path, 'wb')
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=str(self.working_dir),
+                env=self._child_env,
+                stdout=stdout_target,
+                stderr=stderr_target,
+                **self._child_popen_kwargs
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                self._kill_child(proc)
+                await proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            except asyncio.CancelledError:
+                # Interrupted (e.g. Ctrl-C): don't leave the stage's workers running
+                self._kill_child(proc)
+                raise
+        finally:
+            for target in (stdout_target, stderr_target):
+                if target is not asyncio.subprocess.PIPE:
+                    target.close()
+        
+        return subprocess.CompletedProcess(
+            cmd, proc.returncode,
+            stdout.decode('utf-8', errors='replace') if stdout is not None else None,
+            stderr.decode('utf-8', errors='replace') if stderr is not None else None
         )
     
+    def _kill_child(self, proc) -> None:
+        """Kill a stage process, including its process group on POSIX"""
+        try:
+            if self._child_popen_kwargs.get('start_new_session'):
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except ProcessLookupError:
+            pass
+    
     def setup_directories(self) -> bool:
         """Setup workflow directories"""
         step = self.steps['setup']
@@ -289,7 +650,7 @@ class CompleteWorkflow:
             step.fail(str(e))
             return False
     
-    def generate_origen_cards(self) -> bool:
+    async def generate_origen_cards(self) -> bool:
         """Generate ORIGEN power/time cards from burnup database"""
         step = self.steps['origen-generation']
         step.start()
@@ -306,54 +667,36 @@ class CompleteWorkflow:
                 raise FileNotFoundError(f"Burnup database not found: {self.burnup_db}")
             
             # Prepare command for ORIGEN generation
-            cmd = ['python3', str(Path('generate_origen_cards.py').resolve())]
-            cmd.extend(['--db', str(self.burnup_db)])
-            
-            # Add date filters if provided
-            if self.year:
-                cmd.extend(['--year', str(self.year)])
-            if self.start_date:
-                cmd.extend(['--start-date', self.start_date])
-            if self.end_date:
-                cmd.extend(['--end-date', self.end_date])
-            
-            # Use verbose logging
-            cmd.append('--verbose')
+            cmd = ['python3', str(self._origen_gen_script), '--db', str(self.burnup_db),
+                   *self._date_filter_args]
             
             logger.info(f"Running ORIGEN generation: {' '.join(cmd)}")
             
-            # Execute generation
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
+            # Execute generation (stdout is parsed for statistics, stderr only matters on failure)
+            result = await self._run_command(cmd, timeout=600,  # 10 minute timeout
+                                             log_name='origen_generation', log_stdout=False)
             
             if result.returncode != 0:
-                raise RuntimeError(f"ORIGEN generation failed: {result.stderr}")
-            
-            # Find the generated file (it will have date-based naming)
-            generated_files = list(Path('.').glob('origen_cards*.txt'))
-            if not generated_files:
+                _, stderr_log = self._stage_log_paths('origen_generation')
+                raise RuntimeError(f"ORIGEN generation failed: {_read_log_tail(stderr_log)}")
+            
+            # Find the most recently generated file (it will have date-based naming);
+            # scandir entries reuse the directory read instead of stat'ing each candidate path
+            newest_entry, newest_mtime = None, -1.0
+            with os.scandir('.') as it:
+                for entry in it:
+                    if entry.name.startswith('origen_cards') and entry.name.endswith('.txt'):
+                        mtime = entry.stat().st_mtime
+                        if mtime > newest_mtime:
+                            newest_entry, newest_mtime = entry, mtime
+            if newest_entry is None:
                 raise RuntimeError("No ORIGEN cards file was generated")
             
-            # Use the most recently generated file
-            generated_file = max(generated_files, key=lambda f: f.stat().st_mtime)
+            generated_file = Path(newest_entry.name)
             
-            # Move to run directory with error handling
+            # Move to run directory
             target_file = self.run_dir / generated_file.name
-            try:
-                if target_file.exists():
-                    # File already exists, use shutil.move as fallback (overwrites)
-                    shutil.move(str(generated_file), str(target_file))
-                else:
-                    generated_file.rename(target_file)
-            except OSError as e:
-                # Fallback to shutil.move for cross-device moves or permission issues
-                logger.warning(f"rename() failed, using shutil.move: {e}")
-                shutil.move(str(generated_file), str(target_file))
+            _fast_move(generated_file, target_file)
             
             # Update power_time path for subsequent steps
             self.power_time = target_file
@@ -374,7 +717,7 @@ class CompleteWorkflow:
             step.fail(str(e))
             return False
     
-    def verify_origen_cards(self) -> bool:
+    async def verify_origen_cards(self) -> bool:
         """Verify ORIGEN cards against database"""
         step = self.steps['origen-verification']
         step.start()
@@ -395,45 +738,24 @@ class CompleteWorkflow:
                 raise FileNotFoundError(f"Burnup database not found: {self.burnup_db}")
             
             # Prepare command for verification
-            cmd = ['python3', str(Path('verify_origen_cards.py').resolve())]
-            cmd.extend(['--file', str(self.power_time)])
-            cmd.extend(['--db', str(self.burnup_db)])
-            cmd.extend(['--tolerance-power', str(self.origen_tolerance_power)])
-            cmd.extend(['--tolerance-time', str(self.origen_tolerance_time)])
-            
-            # Add same filters as generation
-            if self.year:
-                cmd.extend(['--year', str(self.year)])
-            if self.start_date:
-                cmd.extend(['--start-date', self.start_date])
-            if self.end_date:
-                cmd.extend(['--end-date', self.end_date])
-            
-            # Use verbose logging
-            cmd.append('--verbose')
+            cmd = ['python3', str(self._verify_script),
+                   '--file', str(self.power_time),
+                   '--db', str(self.burnup_db),
+                   '--tolerance-power', str(self.origen_tolerance_power),
+                   '--tolerance-time', str(self.origen_tolerance_time),
+                   *self._date_filter_args]  # Same filters as generation
             
             logger.info(f"Running ORIGEN verification: {' '.join(cmd)}")
             
             # Execute verification
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            result = await self._run_command(cmd, timeout=300)  # 5 minute timeout
             
             # Save verification report
             verification_report = self.run_dir / f"origen_verification_report.txt"
-            with open(verification_report, 'w') as f:
-                f.write("ORIGEN Cards Verification Report\n")
-                f.write("="*50 + "\n")
-                f.write(f"Command: {' '.join(cmd)}\n")
-                f.write(f"Return code: {result.returncode}\n\n")
-                f.write("STDOUT:\n")
-                f.write(result.stdout)
-                f.write("\nSTDERR:\n")
-                f.write(result.stderr)
+            report = (f"ORIGEN Cards Verification Report\n{'=' * 50}\n"
+                      f"Command: {' '.join(cmd)}\nReturn code: {result.returncode}\n\n"
+                      f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}")
+            verification_report.write_bytes(report.encode('utf-8'))
             
             # Verification warnings don't fail the workflow
             if result.returncode != 0:
@@ -458,16 +780,9 @@ class CompleteWorkflow:
         """Parse ORIGEN generation output for statistics"""
         stats = {}
         
-        lines = output.split('\n')
-        for line in lines:
-            if 'Total entries:' in line:
-                stats['origen_total_entries'] = int(line.split(':')[1].strip())
-            elif 'Shutdown periods:' in line:
-                stats['origen_shutdown_periods'] = int(line.split(':')[1].strip())
-            elif 'Power periods:' in line:
-                stats['origen_power_periods'] = int(line.split(':')[1].strip())
-            elif 'Date range:' in line:
-                stats['origen_date_range'] = line.split(':', 1)[1].strip()
+        for match in _ORIGEN_STAT_RE.finditer(output):
+            label, value = match.groups()
+            stats[_ORIGEN_STAT_KEYS[label]] = value if label == 'Date range' else int(value)
         
         return stats
     
@@ -475,18 +790,13 @@ class CompleteWorkflow:
         """Parse verification output for statistics"""
         stats = {}
         
-        lines = output.split('\n')
-        for line in lines:
-            if 'Total entries verified:' in line:
-                stats['verification_total_entries'] = int(line.split(':')[1].strip())
-            elif 'Power discrepancies:' in line:
-                stats['verification_power_discrepancies'] = int(line.split(':')[1].strip())
-            elif 'Time discrepancies:' in line:
-                stats['verification_time_discrepancies'] = int(line.split(':')[1].strip())
+        for match in _VERIFY_STAT_RE.finditer(output):
+            label, value = match.groups()
+            stats[_VERIFY_STAT_KEYS[label]] = int(value)
         
         return stats
     
-    def generate_scale_inputs(self) -> bool:
+    async def generate_scale_inputs(self) -> bool:
         """Generate SCALE input files"""
         step = self.steps['scale-generation']
         step.start()
@@ -494,7 +804,7 @@ class CompleteWorkflow:
         try:
             # Prepare command
             cmd = [
-                'python3', 'generate_scale_input.py',
+                'python3', str(self._scale_input_script),
                 '--flux-json', str(self.flux_json),
                 '--power-time', str(self.power_time),
                 '--split-by-element',
@@ -503,45 +813,34 @@ class CompleteWorkflow:
             
             logger.info(f"Running command: {' '.join(cmd)}")
             
-            # Execute generation
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            # Execute generation (output is only needed on failure, so it goes to logs/)
+            result = await self._run_command(cmd, timeout=300, log_name='scale_generation')  # 5 minute timeout
             
             if result.returncode != 0:
-                raise RuntimeError(f"SCALE generation failed: {result.stderr}")
+                _, stderr_log = self._stage_log_paths('scale_generation')
+                raise RuntimeError(f"SCALE generation failed: {_read_log_tail(stderr_log)}")
             
-            # Find generated files
-            input_files = list((self.run_dir / 'inputs').glob('*.inp'))
-            if not input_files:
+            # Count generated files (only a sample of paths is kept)
+            input_count, input_sample = _scan_files(self.run_dir / 'inputs', '.inp')
+            if not input_count:
                 raise RuntimeError("No SCALE input files were generated")
             
-            self.results['files_generated']['scale_inputs'] = len(input_files)
-            self.results['files_generated']['input_files'] = [str(f) for f in input_files]
+            self.results['files_generated']['scale_inputs'] = input_count
             
-            step.complete([str(f) for f in input_files])
-            logger.info(f"Generated {len(input_files)} SCALE input files")
+            step.complete(input_sample)
+            logger.info(f"Generated {input_count} SCALE input files")
             return True
             
         except Exception as e:
             step.fail(str(e))
             return False
     
-    def run_scale_parallel(self) -> bool:
+    async def run_scale_parallel(self) -> bool:
         """Run SCALE jobs in parallel"""
         step = self.steps['scale-execution']
         step.start()
 
         try:
-            # Check if scale_parallel_runner exists
-            scale_runner = Path('tools/scale_parallel_runner.py')
-            if not scale_runner.exists():
-                raise FileNotFoundError("scale_parallel_runner.py not found in tools/")
-
             # Preflight: check if SCALE executable exists (Windows only, unless using WSL)
             scale_cmd = self.scale_command
             is_wsl = scale_cmd.strip().startswith('wsl ')
@@ -550,7 +849,7 @@ class CompleteWorkflow:
                 exe_path = scale_cmd.split()[0]
                 print(f"Checking SCALE executable: {exe_path}")
                 # Check both absolute path existence and PATH lookup
-                exe_exists = Path(exe_path).exists() or shutil.which(exe_path)
+                exe_exists = _resolve_exe(exe_path)
                 if not exe_exists:
                     logger.error(f"SCALE executable not found: {exe_path}\nCheck your --scale-cmd argument and ensure the path is correct and the file is executable.")
                     step.fail(f"SCALE executable not found: {exe_path}")
@@ -558,7 +857,7 @@ class CompleteWorkflow:
 
             # Prepare command
             cmd = [
-                'python3', str(scale_runner),
+                'python3', str(self._scale_runner),
                 '--directory', str(self.run_dir / 'inputs'),
                 '--workers', str(self.scale_workers),
                 '--scale-cmd', self.scale_command,
@@ -568,52 +867,39 @@ class CompleteWorkflow:
 
             logger.info(f"Running parallel SCALE execution: {' '.join(cmd)}")
 
-            # Execute parallel SCALE jobs
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=7200  # 2 hour timeout
-            )
+            # Execute parallel SCALE jobs (output goes to logs/, it can run to thousands of lines)
+            result = await self._run_command(cmd, timeout=7200, log_name='scale_execution')  # 2 hour timeout
+            stdout_log, stderr_log = self._stage_log_paths('scale_execution')
 
             if result.returncode != 0:
-                raise RuntimeError(f"SCALE parallel execution failed: {result.stderr}")
+                raise RuntimeError(f"SCALE parallel execution failed: {_read_log_tail(stderr_log)}")
 
             # Count output files
-            output_files = list((self.run_dir / 'inputs').glob('*.out'))
-            msg_files = list((self.run_dir / 'inputs').glob('*.msg'))
-
-            self.results['files_generated']['scale_outputs'] = len(output_files)
-            self.results['files_generated']['msg_files'] = len(msg_files)
-
-            # Parse execution results from stdout
-            stdout_lines = result.stdout.split('\n')
-            for line in stdout_lines:
-                if 'Successful:' in line:
-                    self.results['statistics']['successful_jobs'] = int(line.split(':')[1].strip())
-                elif 'Failed:' in line:
-                    self.results['statistics']['failed_jobs'] = int(line.split(':')[1].strip())
-
-            step.complete([str(f) for f in output_files])
-            logger.info(f"SCALE execution completed: {len(output_files)} output files generated")
+            output_count, output_sample = _scan_files(self.run_dir / 'inputs', '.out')
+            msg_count, _ = _scan_files(self.run_dir / 'inputs', '.msg', sample_size=0)
+
+            self.results['files_generated']['scale_outputs'] = output_count
+            self.results['files_generated']['msg_files'] = msg_count
+
+            # Parse execution results from the stdout log
+            for label, value in _scan_log(stdout_log, _SCALE_JOBS_RE):
+                key = 'successful_jobs' if label == b'Successful' else 'failed_jobs'
+                self.results['statistics'][key] = int(value)
+
+            step.complete(output_sample)
+            logger.info(f"SCALE execution completed: {output_count} output files generated")
             return True
 
         except Exception as e:
             step.fail(str(e))
             return False
     
-    def generate_mcnp_cards(self) -> bool:
+    async def generate_mcnp_cards(self) -> bool:
         """Generate MCNP material cards from SCALE outputs"""
         step = self.steps['mcnp-generation']
         step.start()
         
         try:
-            # Check if parallel parser exists
-            parser_script = Path('tools/parallel_parseOutput_processor.py')
-            if not parser_script.exists():
-                raise FileNotFoundError("parallel_parseOutput_processor.py not found in tools/")
-            
             # Prepare output paths with date information
             date_suffix = f"_{self.date_metadata['date_range_str']}" if self.date_metadata['date_range_str'] != 'unknown' else ""
             mcnp_output = self.run_dir / 'mcnp_cards' / f'mcnp_materials_all{date_suffix}.txt'
@@ -622,7 +908,7 @@ class CompleteWorkflow:
             
             # Prepare command
             cmd = [
-                'python3', str(parser_script),
+                'python3', str(self._parser_script),
                 '--input-dir', str(self.run_dir / 'inputs'),
                 '--workers', str(self.parse_workers),
                 '--executor', self.parse_executor,
@@ -634,35 +920,36 @@ class CompleteWorkflow:
             
             logger.info(f"Running parallel MCNP card generation: {' '.join(cmd)}")
             
-            # Execute parallel parsing
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=1800  # 30 minute timeout
-            )
+            # Execute parallel parsing (one line per element, so output goes to logs/)
+            result = await self._run_command(cmd, timeout=1800, log_name='mcnp_generation')  # 30 minute timeout
             
             if result.returncode != 0:
-                raise RuntimeError(f"MCNP card generation failed: {result.stderr}")
-            
-            # Verify output files
-            output_files = [mcnp_output, summary_output, db_output]
-            existing_files = [f for f in output_files if f.exists()]
-            
-            if not existing_files:
-                raise RuntimeError("No MCNP output files were generated")
-            
-            # Load summary statistics if available
-            if summary_output.exists():
-                with open(summary_output, 'r') as f:
-                    summary_data = json.load(f)
-                    self.results['statistics'].update(summary_data.get('processing_info', {}))
+                _, stderr_log = self._stage_log_paths('mcnp_generation')
+                raise RuntimeError(f"MCNP card generation failed: {_read_log_tail(stderr_log)}")
+            
+            # Verify output files with one directory listing, loading the summary
+            # statistics (if available) concurrently
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                processing_info = pool.submit(_load_processing_info, summary_output)
+                with os.scandir(self.run_dir / 'mcnp_cards') as it:
+                    present = {entry.name for entry in it}
+                existing_files = [f for f in (mcnp_output, summary_output, db_output) if f.name in present]
+                
+                if not existing_files:
+                    raise RuntimeError("No MCNP output files were generated")
+                
+                self.results['statistics'].update(processing_info.result())
             
             self.results['files_generated']['mcnp_materials'] = str(mcnp_output)
             self.results['files_generated']['processing_summary'] = str(summary_output)
             self.results['files_generated']['materials_database'] = str(db_output)
             
+            if db_output in existing_files:
+                try:
+                    _optimize_materials_db(db_output)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not optimize materials database {db_output}: {e}")
+            
             step.complete([str(f) for f in existing_files])
             logger.info(f"MCNP card generation completed: {len(existing_files)} files generated")
             return True
@@ -689,37 +976,38 @@ class CompleteWorkflow:
                 logger.info(str(self.run_dir))
                 
                 # Archive large output files
-                large_files = list((self.run_dir / 'inputs').glob('*.out'))
+                # One scandir walk both finds the large outputs and feeds the archive
+                files = list(_walk_files(self.run_dir / 'inputs'))
+                large_files = frozenset(name for _, name in files if name.endswith('.out') and '/' not in name)
                 if large_files:
-                    shutil.make_archive(
-                        str(archive_dir / 'scale_outputs'),
-                        'zip',
-                        str(self.run_dir / 'inputs'),
-                        base_dir='.'
-                    )
-                    # Remove original large files
-                    for f in large_files:
-                        f.unlink()
+                    # Original large files are removed once the archive is complete
+                    _archive_directory(files, archive_dir / 'scale_outputs.zip',
+                                       remove=large_files, workers=self.scale_workers)
                 
             elif cleanup_level == 'aggressive':
                 # Keep only final results
                 logger.info("Aggressive cleanup: keeping only final results")
                 
-                # Archive all intermediate files
-                shutil.make_archive(
-                    str(archive_dir / 'all_intermediate'),
-                    'zip',
-                    str(self.run_dir / 'inputs'),
-                    base_dir='.'
-                )
+                # Archive all intermediate files (stored uncompressed: downstream tools recompress it)
+                _archive_directory(_walk_files(self.run_dir / 'inputs'), archive_dir / 'all_intermediate.zip',
+                                   compression=zipfile.ZIP_STORED, workers=self.scale_workers)
                 
                 # Remove input directory
                 shutil.rmtree(self.run_dir / 'inputs')
             
             # Create workflow summary
+            # Written beside the target and renamed over it, so a crash never leaves a truncated summary
             summary_file = self.run_dir / 'workflow_summary.json'
-            with open(summary_file, 'w') as f:
-                json.dump(self.results, f, indent=2, default=str)
+            tmp_file = summary_file.with_suffix('.json.tmp')
+            if orjson is not None:
+                # Datetimes are passed through to default=str so timestamps keep the stdlib format
+                payload = orjson.dumps(
+                    self.results, default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+            else:
+                payload = json.dumps(self.results, indent=2, default=str).encode('utf-8')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, summary_file)
             
             step.complete([str(summary_file)])
             logger.info(f"Cleanup completed with level: {cleanup_level}")
@@ -734,6 +1022,7 @@ class CompleteWorkflow:
         """Execute the complete workflow"""
         
         self.results['start_time'] = datetime.now()
+        t0_ns = time.perf_counter_ns()
         logger.info(f"Starting complete workflow: {self.run_name}")
         
         # Define step order
@@ -751,42 +1040,22 @@ class CompleteWorkflow:
         
         # Execute steps
         try:
-            for i, step_name in enumerate(step_order):
-                if i < start_index:
-                    self.steps[step_name].skip("Skipped due to resume point")
-                    continue
-                
-                success = False
-                
-                if step_name == 'setup':
-                    success = self.setup_directories()
-                elif step_name == 'origen-generation':
-                    success = self.generate_origen_cards()
-                elif step_name == 'origen-verification':
-                    success = self.verify_origen_cards()
-                elif step_name == 'scale-generation':
-                    success = self.generate_scale_inputs()
-                elif step_name == 'scale-execution':
-                    success = self.run_scale_parallel()
-                elif step_name == 'mcnp-generation':
-                    success = self.generate_mcnp_cards()
-                elif step_name == 'cleanup':
-                    success = self.cleanup_and_archive(cleanup_level)
-                
-                if not success:
-                    logger.error(f"Workflow failed at step: {step_name}")
+            for step_name in step_order[:start_index]:
+                self.steps[step_name].skip("Skipped due to resume point")
+            if start_index:
+                self._replay_events()
+            
+            try:
+                if not asyncio.run(self._run_steps(step_order[start_index:], cleanup_level)):
                     return False
-                
-                # Update results
-                self.results['steps'][step_name] = {
-                    'status': self.steps[step_name].status,
-                    'duration': (self.steps[step_name].end_time - self.steps[step_name].start_time).total_seconds() if self.steps[step_name].end_time else None,
-                    'output_files': self.steps[step_name].output_files
-                }
+            finally:
+                if self._event_log is not None:
+                    self._event_log.close()
+                    self._event_log = None
             
             # Workflow completed successfully
             self.results['end_time'] = datetime.now()
-            self.results['total_duration'] = (self.results['end_time'] - self.results['start_time']).total_seconds()
+            self.results['total_duration'] = (time.perf_counter_ns() - t0_ns) * 1e-9
             
             logger.info(f"Workflow completed successfully in {self.results['total_duration']:.1f} seconds")
             logger.info(f"Results available in: {self.run_dir}")
@@ -799,34 +1068,117 @@ class CompleteWorkflow:
             logger.error(f"Workflow failed with exception: {e}")
             return False
     
+    async def _run_steps(self, step_names: List[str], cleanup_level: str) -> bool:
+        """
+        Run workflow steps in order
+        
+        ORIGEN verification and SCALE input generation both depend only on the
+        power/time cards, so when both are due they run concurrently.
+        """
+        i = 0
+        while i < len(step_names):
+            batch = [step_names[i]]
+            if step_names[i:i + 2] == ['origen-verification', 'scale-generation']:
+                batch.append('scale-generation')
+            
+            files_before = dict(self.results['files_generated'])
+            stats_before = dict(self.results['statistics'])
+            
+            outcomes = await asyncio.gather(*(self._run_step(name, cleanup_level) for name in batch))
+            
+            for step_name, success in zip(batch, outcomes):
+                if not success:
+                    logger.error(f"Workflow failed at step: {step_name}")
+                    return False
+                
+                # Update results
+                self.results['steps'][step_name] = self.steps[step_name].snapshot()
+                self._emit('step', step=step_name, record=self.results['steps'][step_name])
+            
+            self._emit('results',
+                       files_generated={k: v for k, v in self.results['files_generated'].items()
+                                        if k not in files_before or files_before[k] != v},
+                       statistics={k: v for k, v in self.results['statistics'].items()
+                                   if k not in stats_before or stats_before[k] != v})
+            i += len(batch)
+        
+        return True
+    
+    def _emit(self, kind: str, **fields) -> None:
+        """Append a results event to <run_dir>/events.jsonl (one line, O(delta) per step)"""
+        if self._event_log is None:
+            self._event_log = open(self.run_dir / 'events.jsonl', 'a', buffering=1)
+        self._event_log.write(json.dumps({'t': time.time(), 'kind': kind, **fields}, default=str) + '\n')
+    
+    def _replay_events(self) -> None:
+        """Fold the events.jsonl of an earlier run back into self.results when resuming"""
+        events_file = self.run_dir / 'events.jsonl'
+        if not events_file.exists():
+            return
+        
+        with open(events_file, 'r') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn final line from an interrupted run
+                if event['kind'] == 'step':
+                    self.results['steps'][event['step']] = event['record']
+                elif event['kind'] == 'results':
+                    self.results['files_generated'].update(event['files_generated'])
+                    self.results['statistics'].update(event['statistics'])
+        logger.info(f"Restored results of earlier steps from {events_file}")
+    
+    async def _run_step(self, step_name: str, cleanup_level: str) -> bool:
+        """Dispatch a single workflow step"""
+        if step_name == 'setup':
+            return self.setup_directories()
+        elif step_name == 'origen-generation':
+            return await self.generate_origen_cards()
+        elif step_name == 'origen-verification':
+            return await self.verify_origen_cards()
+        elif step_name == 'scale-generation':
+            return await self.generate_scale_inputs()
+        elif step_name == 'scale-execution':
+            return await self.run_scale_parallel()
+        elif step_name == 'mcnp-generation':
+            return await self.generate_mcnp_cards()
+        elif step_name == 'cleanup':
+            return self.cleanup_and_archive(cleanup_level)
+        return False
+    
     def print_summary(self):
-        """Print workflow execution summary"""
-        print("\n" + "="*80)
-        print(f"WORKFLOW SUMMARY: {self.run_name}")
-        print("="*80)
-        print(f"Run Directory: {self.run_dir}")
-        print(f"Total Duration: {self.results['total_duration']:.1f} seconds")
-        print("")
-        
-        print("STEPS:")
+        """Print workflow execution summary (assembled first, then written in one call)"""
+        lines = [
+            "",
+            _BAR,
+            f"WORKFLOW SUMMARY: {self.run_name}",
+            _BAR,
+            f"Run Directory: {self.run_dir}",
+            f"Total Duration: {self.results['total_duration']:.1f} seconds",
+            "",
+            "STEPS:",
+        ]
         for step_name, step_data in self.results['steps'].items():
             status_emoji = "✅" if step_data['status'] == 'completed' else "❌" if step_data['status'] == 'failed' else "⏭️"
             duration_str = f"({step_data['duration']:.1f}s)" if step_data['duration'] else ""
-            print(f"  {status_emoji} {step_name}: {step_data['status']} {duration_str}")
+            lines.append(f"  {status_emoji} {step_name}: {step_data['status']} {duration_str}")
         
-        print(f"\nFILES GENERATED:")
+        lines.append("\nFILES GENERATED:")
         for file_type, count_or_path in self.results['files_generated'].items():
             if isinstance(count_or_path, int):
-                print(f"  - {file_type}: {count_or_path} files")
+                lines.append(f"  - {file_type}: {count_or_path} files")
             else:
-                print(f"  - {file_type}: {count_or_path}")
+                lines.append(f"  - {file_type}: {count_or_path}")
         
         if self.results['statistics']:
-            print(f"\nSTATISTICS:")
+            lines.append("\nSTATISTICS:")
             for key, value in self.results['statistics'].items():
-                print(f"  - {key}: {value}")
+                lines.append(f"  - {key}: {value}")
         
-        print("="*80)
+        lines.append(_BAR)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 def main():
     """Command line interface for the complete workflow"""
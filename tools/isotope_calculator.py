@@ -9,9 +9,11 @@ Uses the mendeleev library for isotope data and natural abundances.
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -22,10 +24,16 @@ except ImportError:
     print("Install with: pip install mendeleev")
     sys.exit(1)
 
+# Chemical formula token: Element (optional isotope) + optional count
+_FORMULA_RE = re.compile(r'([A-Z][a-z]?)(?:\-(\d+))?(\d*\.?\d*)')
 
-@dataclass
+# Each element() call is a query against mendeleev's SQLAlchemy-backed database
+_element = functools.lru_cache(maxsize=128)(element)
+
+
+@dataclass(frozen=True)
 class IsotopeInfo:
-    """Information about a specific isotope"""
+    """Information about a specific isotope (immutable: cached lists share these records)"""
     element_symbol: str
     mass_number: int
     atomic_mass: float
@@ -41,42 +49,76 @@ class ElementComposition:
     enrichments: Dict[int, float]  # mass_number -> enrichment fraction
 
 
+# Finished isotope fractions keyed by (formula, normalized enrichments); compositions recur constantly
+_FRACTIONS_CACHE: Dict[tuple, Dict[str, float]] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _load_isotopes(element_symbol: str, artificial: Tuple[int, ...] = ()) -> Tuple[IsotopeInfo, ...]:
+    """Natural isotopes of an element plus the requested artificial ones, sorted by mass number"""
+    elem = _element(element_symbol)
+    isotopes = []
+    
+    # Get isotopes with natural abundance > 0
+    for isotope in elem.isotopes:
+        if isotope.abundance and isotope.abundance > 0:
+            isotopes.append(IsotopeInfo(
+                element_symbol=element_symbol,
+                mass_number=isotope.mass_number,
+                atomic_mass=isotope.mass or isotope.mass_number,
+                abundance=isotope.abundance / 100.0  # Convert from % to fraction
+            ))
+    
+    # Add artificial isotopes if requested (with 0% natural abundance)
+    for mass_number in artificial:
+        # Find this specific isotope
+        for isotope in elem.isotopes:
+            if isotope.mass_number == mass_number:
+                # Check if we already have it (shouldn't happen for artificial ones)
+                if not any(iso.mass_number == mass_number for iso in isotopes):
+                    isotopes.append(IsotopeInfo(
+                        element_symbol=element_symbol,
+                        mass_number=isotope.mass_number,
+                        atomic_mass=isotope.mass or isotope.mass_number,
+                        abundance=0.0  # Artificial isotope starts with 0% natural abundance
+                    ))
+                break
+    
+    # Sort by mass number
+    isotopes.sort(key=lambda x: x.mass_number)
+    return tuple(isotopes)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_formula(formula: str) -> Tuple[Tuple[str, float, Tuple[Tuple[int, float], ...]], ...]:
+    """Tokenize a chemical formula into immutable (symbol, count, enrichment items) entries"""
+    # Remove spaces and handle parentheses (basic support)
+    formula = formula.replace(' ', '')
+    
+    # TODO: Add support for parentheses groups like Ca(OH)2
+    counts = {}
+    enrichments = {}
+    
+    for element_symbol, isotope_str, count_str in _FORMULA_RE.findall(formula):
+        counts[element_symbol] = counts.get(element_symbol, 0.0) + (float(count_str) if count_str else 1.0)
+        element_enrichments = enrichments.setdefault(element_symbol, {})
+        
+        # Handle specific isotope notation (e.g., U-235)
+        if isotope_str and int(isotope_str):
+            element_enrichments[int(isotope_str)] = 1.0
+    
+    return tuple((symbol, count, tuple(enrichments[symbol].items())) for symbol, count in counts.items())
+
+
 class ChemicalFormulaParser:
     """Parser for chemical formulas"""
     
-    def __init__(self):
-        # Regex pattern for parsing chemical formulas
-        # Matches: Element (optional isotope) + optional count
-        self.pattern = re.compile(r'([A-Z][a-z]?)(?:\-(\d+))?(\d*\.?\d*)')
-    
     def parse(self, formula: str) -> Dict[str, ElementComposition]:
-        """Parse a chemical formula into element compositions"""
-        # Remove spaces and handle parentheses (basic support)
-        formula = formula.replace(' ', '')
-        
-        # TODO: Add support for parentheses groups like Ca(OH)2
-        elements = {}
-        
-        for match in self.pattern.finditer(formula):
-            element_symbol = match.group(1)
-            isotope = int(match.group(2)) if match.group(2) else None
-            count_str = match.group(3)
-            count = float(count_str) if count_str else 1.0
-            
-            if element_symbol not in elements:
-                elements[element_symbol] = ElementComposition(
-                    symbol=element_symbol,
-                    count=0.0,
-                    enrichments={}
-                )
-            
-            elements[element_symbol].count += count
-            
-            # Handle specific isotope notation (e.g., U-235)
-            if isotope:
-                elements[element_symbol].enrichments[isotope] = 1.0
-        
-        return elements
+        """Parse a chemical formula into element compositions (fresh objects over a cached tokenization)"""
+        return {
+            symbol: ElementComposition(symbol=symbol, count=count, enrichments=dict(enrichments))
+            for symbol, count, enrichments in _parse_formula(formula)
+        }
 
 
 class IsotopeCalculator:
@@ -95,38 +137,9 @@ class IsotopeCalculator:
             include_artificial: List of mass numbers for artificial isotopes to include
         """
         try:
-            elem = element(element_symbol)
-            isotopes = []
-            
-            # Get isotopes with natural abundance > 0
-            for isotope in elem.isotopes:
-                if isotope.abundance and isotope.abundance > 0:
-                    isotopes.append(IsotopeInfo(
-                        element_symbol=element_symbol,
-                        mass_number=isotope.mass_number,
-                        atomic_mass=isotope.mass or isotope.mass_number,
-                        abundance=isotope.abundance / 100.0  # Convert from % to fraction
-                    ))
-            
-            # Add artificial isotopes if requested (with 0% natural abundance)
-            if include_artificial:
-                for mass_number in include_artificial:
-                    # Find this specific isotope
-                    for isotope in elem.isotopes:
-                        if isotope.mass_number == mass_number:
-                            # Check if we already have it (shouldn't happen for artificial ones)
-                            if not any(iso.mass_number == mass_number for iso in isotopes):
-                                isotopes.append(IsotopeInfo(
-                                    element_symbol=element_symbol,
-                                    mass_number=isotope.mass_number,
-                                    atomic_mass=isotope.mass or isotope.mass_number,
-                                    abundance=0.0  # Artificial isotope starts with 0% natural abundance
-                                ))
-                            break
-            
-            # Sort by mass number
-            isotopes.sort(key=lambda x: x.mass_number)
-            return isotopes
+            # Cached per (symbol, artificial masses); the sorted tuple keeps the key hashable and order-free
+            artificial = tuple(sorted(set(include_artificial))) if include_artificial else ()
+            return list(_load_isotopes(element_symbol, artificial))
             
         except Exception as e:
             raise ValueError(f"Could not find element {element_symbol}: {e}")
@@ -146,41 +159,49 @@ class IsotopeCalculator:
         
         remaining_fraction = 1.0 - total_enriched
         
+        # Natural isotopes share what the enrichments leave over, in proportion to their abundance
+        natural_sum = sum(iso.abundance for iso in isotopes if iso.mass_number not in enrichments)
+        scale_factor = remaining_fraction / natural_sum if natural_sum > 0 else 0.0
+        
         for isotope in isotopes:
-            new_isotope = IsotopeInfo(
-                element_symbol=isotope.element_symbol,
-                mass_number=isotope.mass_number,
-                atomic_mass=isotope.atomic_mass,
-                abundance=isotope.abundance,
-                enriched_abundance=isotope.abundance
-            )
-            
             if isotope.mass_number in enrichments:
                 # Set specific enrichment
-                new_isotope.enriched_abundance = enrichments[isotope.mass_number]
+                enriched_abundance = enrichments[isotope.mass_number]
             else:
                 # Scale down natural abundance proportionally
-                natural_sum = sum(iso.abundance for iso in isotopes 
-                                if iso.mass_number not in enrichments)
-                if natural_sum > 0:
-                    scale_factor = remaining_fraction / natural_sum
-                    new_isotope.enriched_abundance = isotope.abundance * scale_factor
-                else:
-                    new_isotope.enriched_abundance = 0.0
+                enriched_abundance = isotope.abundance * scale_factor
             
-            enriched_isotopes.append(new_isotope)
+            enriched_isotopes.append(IsotopeInfo(
+                element_symbol=isotope.element_symbol,
+                mass_number=isotope.mass_number,
+                atomic_mass=isotope.atomic_mass,
+                abundance=isotope.abundance,
+                enriched_abundance=enriched_abundance
+            ))
         
         return enriched_isotopes
     
-    def calculate_molecular_weight(self, elements: Dict[str, ElementComposition]) -> float:
-        """Calculate the molecular weight of the compound"""
-        total_weight = 0.0
+    def _compute_enriched(self, elements: Dict[str, ElementComposition]) -> Dict[str, List[IsotopeInfo]]:
+        """Look up and enrich the isotopes of every element in the compound"""
+        enriched = {}
         
         for element_comp in elements.values():
             # Include artificial isotopes if they're specified in enrichments
             artificial_masses = list(element_comp.enrichments.keys()) if element_comp.enrichments else None
             isotopes = self.get_element_isotopes(element_comp.symbol, artificial_masses)
-            enriched_isotopes = self.apply_enrichments(isotopes, element_comp.enrichments)
+            enriched[element_comp.symbol] = self.apply_enrichments(isotopes, element_comp.enrichments)
+        
+        return enriched
+    
+    def calculate_molecular_weight(self, elements: Dict[str, ElementComposition],
+                                   enriched: Optional[Dict[str, List[IsotopeInfo]]] = None) -> float:
+        """Calculate the molecular weight of the compound (reusing `enriched` from _compute_enriched if given)"""
+        if enriched is None:
+            enriched = self._compute_enriched(elements)
+        total_weight = 0.0
+        
+        for element_comp in elements.values():
+            enriched_isotopes = enriched[element_comp.symbol]
             
             # Calculate average atomic mass for this element
             avg_atomic_mass = sum(iso.atomic_mass * (iso.enriched_abundance or iso.abundance) 
@@ -202,6 +223,12 @@ class IsotopeCalculator:
         Returns:
             Dict mapping isotope names (e.g., "H-1", "O-16") to weight fractions
         """
+        key = (formula, tuple(sorted((symbol, tuple(sorted(masses.items())))
+                                     for symbol, masses in (enrichments or {}).items())))
+        cached = _FRACTIONS_CACHE.get(key)
+        if cached is not None:
+            return dict(cached)
+        
         elements = self.parser.parse(formula)
         
         # Apply user-specified enrichments
@@ -210,19 +237,17 @@ class IsotopeCalculator:
                 if element_symbol in elements:
                     elements[element_symbol].enrichments.update(element_enrichments)
         
+        # Isotope lookup and enrichment is done once and shared by both passes
+        enriched = self._compute_enriched(elements)
+        
         # Calculate molecular weight
-        molecular_weight = self.calculate_molecular_weight(elements)
+        molecular_weight = self.calculate_molecular_weight(elements, enriched)
         
         # Calculate isotope weight fractions
         isotope_fractions = {}
         
         for element_comp in elements.values():
-            # Include artificial isotopes if they're specified in enrichments
-            artificial_masses = list(element_comp.enrichments.keys()) if element_comp.enrichments else None
-            isotopes = self.get_element_isotopes(element_comp.symbol, artificial_masses)
-            enriched_isotopes = self.apply_enrichments(isotopes, element_comp.enrichments)
-            
-            for isotope in enriched_isotopes:
+            for isotope in enriched[element_comp.symbol]:
                 abundance = isotope.enriched_abundance or isotope.abundance
                 isotope_weight = (isotope.atomic_mass * abundance * element_comp.count)
                 weight_fraction = isotope_weight / molecular_weight
@@ -230,7 +255,8 @@ class IsotopeCalculator:
                 isotope_name = f"{isotope.element_symbol}-{isotope.mass_number}"
                 isotope_fractions[isotope_name] = weight_fraction
         
-        return isotope_fractions
+        _FRACTIONS_CACHE[key] = isotope_fractions
+        return dict(isotope_fractions)
 
 
 def main():
@@ -289,24 +315,18 @@ Examples:
         sys.exit(1)
     
     # Parse enrichments
-    enrichments = {}
-    if args.enrich:
-        for enrich_str in args.enrich:
-            try:
-                element, mass_str, fraction_str = enrich_str.split(':')
-                mass_number = int(mass_str)
-                fraction = float(fraction_str)
-                
-                if fraction < 0 or fraction > 1:
-                    raise ValueError("Enrichment fraction must be between 0 and 1")
-                
-                if element not in enrichments:
-                    enrichments[element] = {}
-                enrichments[element][mass_number] = fraction
-                
-            except ValueError as e:
-                print(f"Error parsing enrichment '{enrich_str}': {e}")
-                sys.exit(1)
+    enrichments = defaultdict(dict)
+    for enrich_str in args.enrich or ():
+        try:
+            element, mass_str, fraction_str = enrich_str.split(':')
+            fraction = float(fraction_str)
+            if not 0.0 <= fraction <= 1.0:
+                raise ValueError("Enrichment fraction must be between 0 and 1")
+            enrichments[element][int(mass_str)] = fraction
+            
+        except ValueError as e:
+            print(f"Error parsing enrichment '{enrich_str}': {e}")
+            sys.exit(1)
     
     # Calculate isotope fractions
     calculator = IsotopeCalculator()
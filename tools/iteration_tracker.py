@@ -5,12 +5,94 @@ Provides cycle status, material database inspection, and workflow assistance.
 """
 
 import sqlite3
-import argparse
+import itertools
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-import json
-from datetime import datetime
+from typing import Dict, Iterator, List, Tuple
+
+# Status query: latest cycle, material total (exact COUNT(*) or MAX(rowid)) and either the
+# latest cycle's elements or just their count. Keyed by (exact_count, include_elements).
+_STATUS_CTE = """
+    WITH s AS (
+        SELECT (SELECT MAX(cycle_number) FROM materials) AS latest_cycle,
+               (SELECT {total} FROM materials) AS total_materials
+    )
+"""
+_STATUS_ELEMENTS = """
+    SELECT s.latest_cycle, s.total_materials, m.element_name, m.case_name, m.total_mass_g
+    FROM s LEFT JOIN materials m ON m.cycle_number = s.latest_cycle
+    ORDER BY m.element_name, m._ROWID_
+"""
+_STATUS_ELEMENT_COUNT = """
+    SELECT s.latest_cycle, s.total_materials,
+           (SELECT COUNT(*) FROM materials WHERE cycle_number = s.latest_cycle)
+    FROM s
+"""
+_STATUS_SQL = {
+    (exact, include): _STATUS_CTE.format(total="COUNT(*)" if exact else "MAX(_ROWID_)")
+                      + (_STATUS_ELEMENTS if include else _STATUS_ELEMENT_COUNT)
+    for exact in (True, False) for include in (True, False)
+}
+
+_CYCLES_SQL = """
+    SELECT cycle_number, COUNT(*) as material_count,
+           MIN(time_point) as earliest_time
+    FROM materials
+    GROUP BY cycle_number
+    ORDER BY cycle_number
+"""
+
+_ELEMENT_HISTORY_SQL = """
+    SELECT cycle_number AS cycle, total_mass_g, density_g_cm3,
+           helium_mass_g, time_point, case_name
+    FROM materials
+    WHERE element_name = ?
+    ORDER BY cycle_number
+"""
+
+# Indexes behind the lookups above: element history (WHERE element_name ORDER BY cycle_number)
+# and the per-cycle queries. (cycle_number, time_point) also covers the cycle listing, so its
+# GROUP BY streams in index order and COUNT/MIN never touch the table.
+_INDEXES = {
+    'idx_mat_element_cycle': "CREATE INDEX IF NOT EXISTS idx_mat_element_cycle ON materials(element_name, cycle_number)",
+    'idx_mat_cycle_time': "CREATE INDEX IF NOT EXISTS idx_mat_cycle_time ON materials(cycle_number, time_point)",
+}
+
+# suggest_next_step() messages
+_NO_DATABASE_STEP = """
+SUGGESTED NEXT STEP:
+1. Run parseOutput.py to create initial material database from SCALE output
+   Command: python tools/parseOutput.py
+   
+This will parse the SCALE output and create the materials database.
+"""
+
+_DATABASE_ERROR_TMPL = """
+DATABASE ERROR: {error}
+Check database integrity and fix any issues before proceeding.
+"""
+
+_EMPTY_DATABASE_STEP = """
+SUGGESTED NEXT STEP:
+1. Database exists but contains no materials
+2. Run parseOutput.py to populate with initial data
+   Command: python tools/parseOutput.py
+"""
+
+_NEXT_STEP_TMPL = """
+CURRENT STATUS: Cycle {latest} complete with {element_count} elements
+
+SUGGESTED NEXT STEP:
+1. Generate SCALE input using cycle {latest} materials:
+   Command: python generate_scale_input.py --flux-json sample_flux_data.json --power-time sample_origen_cards.txt --materials-db materials.db --cycle {latest}
+
+2. Run SCALE simulation with generated input file
+
+3. After SCALE completes, parse output for cycle {next}:
+   Command: python tools/parseOutput.py --cycle {next}
+
+4. Update flux data for next iteration (manual MCNP step)
+"""
 
 class IterationTracker:
     """Simple tracking utility for manual burnup iterations."""
@@ -23,11 +105,59 @@ class IterationTracker:
             db_path: Path to the materials database
         """
         self.db_path = Path(db_path)
+        self._conn = None  # Opened on first query and reused, keeping SQLite's page and statement caches warm
+        self._db_error = None  # First SQLite error; later calls short-circuit instead of retrying
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared (read-only) database connection, opening it on first use."""
+        if self._conn is None:
+            # Every query here is a read: mode=ro skips write-lock negotiation and journal files
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                   cached_statements=32)
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")    # ORDER BY/GROUP BY scratch B-trees
+            conn.execute("PRAGMA cache_size=-64000")    # 64 MB page cache
+            self._ensure_indexes(conn)
+            self._conn = conn
+        return self._conn
+    
+    def _ensure_indexes(self, conn: sqlite3.Connection):
+        """Create any missing lookup indexes (skipped when the database cannot be written)."""
+        existing = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        missing = [sql for name, sql in _INDEXES.items() if name not in existing]
+        if not missing:
+            return
+        
+        # One short-lived writable connection, only when an index is actually missing
+        writer = sqlite3.connect(self.db_path)
+        try:
+            for sql in missing:
+                writer.execute(sql)
+            writer.commit()
+        except sqlite3.OperationalError:
+            # Read-only/locked database or no materials table: queries still work, just unindexed
+            writer.rollback()
+        finally:
+            writer.close()
+    
+    def close(self):
+        """Close the shared database connection, if open."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
         
-    def get_cycle_status(self) -> Dict[str, any]:
+    def get_cycle_status(self, exact_count: bool = True, include_elements: bool = True) -> Dict[str, any]:
         """
         Get current cycle status from database.
         
+        Args:
+            exact_count: Count materials with COUNT(*) (a full table scan). When False,
+                         'total_materials' is MAX(rowid), a single B-tree lookup that equals
+                         the row count for the append-only tables written by parseOutput.py
+                         but overcounts if rows were ever deleted.
+            include_elements: Fetch the latest cycle's (element, case, mass) rows. When False,
+                              'elements' is left empty and only 'element_count' is filled in.
+        
         Returns:
             Dictionary with cycle information
         """
@@ -36,47 +166,55 @@ class IterationTracker:
                 'database_exists': False,
                 'latest_cycle': None,
                 'total_materials': 0,
-                'elements': []
+                'elements': [],
+                'element_count': 0
             }
         
+        if self._db_error is not None:
+            return self._error_status()
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get latest cycle number
-                cursor.execute("SELECT MAX(cycle_number) FROM materials")
-                latest_cycle = cursor.fetchone()[0]
-                
-                # Get total materials count
-                cursor.execute("SELECT COUNT(*) FROM materials")
-                total_materials = cursor.fetchone()[0]
-                
-                # Get elements in latest cycle
-                if latest_cycle is not None:
-                    cursor.execute("""
-                        SELECT element_name, case_name, total_mass_g 
-                        FROM materials 
-                        WHERE cycle_number = ?
-                        ORDER BY element_name
-                    """, (latest_cycle,))
-                    elements = cursor.fetchall()
-                else:
-                    elements = []
-                
-                return {
-                    'database_exists': True,
-                    'latest_cycle': latest_cycle,
-                    'total_materials': total_materials,
-                    'elements': elements
-                }
-        except Exception as e:
+            cursor = self._connection().cursor()
+            
+            # Latest cycle number, total materials count and the elements in the latest
+            # cycle in one round trip. Scalar subqueries keep SQLite's single-aggregate
+            # MIN/MAX optimization (an index seek) for each lookup.
+            cursor.execute(_STATUS_SQL[exact_count, include_elements])
+            rows = cursor.fetchall()
+            latest_cycle = rows[0][0]
+            total_materials = rows[0][1] or 0
+            
+            if not include_elements:
+                elements = []
+                element_count = rows[0][2]
+            elif latest_cycle is not None:  # (with no cycles the LEFT JOIN yields one all-NULL row)
+                elements = [row[2:] for row in rows]
+                element_count = len(elements)
+            else:
+                elements = []
+                element_count = 0
+            
             return {
                 'database_exists': True,
-                'error': str(e),
-                'latest_cycle': None,
-                'total_materials': 0,
-                'elements': []
+                'latest_cycle': latest_cycle,
+                'total_materials': total_materials,
+                'elements': elements,
+                'element_count': element_count
             }
+        except sqlite3.DatabaseError as e:
+            self._db_error = str(e)
+            return self._error_status()
+    
+    def _error_status(self) -> Dict[str, any]:
+        """Status dictionary reporting the recorded database error."""
+        return {
+            'database_exists': True,
+            'error': self._db_error,
+            'latest_cycle': None,
+            'total_materials': 0,
+            'elements': [],
+            'element_count': 0
+        }
     
     def list_all_cycles(self) -> List[Tuple[int, int, str]]:
         """
@@ -85,22 +223,22 @@ class IterationTracker:
         Returns:
             List of (cycle_number, material_count, date) tuples
         """
-        if not self.db_path.exists():
-            return []
+        return list(self.iter_cycles())
+    
+    def iter_cycles(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        Stream (cycle_number, material_count, date) tuples straight from the cursor.
+        
+        Yields nothing if the database is missing or cannot be queried.
+        """
+        if not self.db_path.exists() or self._db_error is not None:
+            return
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT cycle_number, COUNT(*) as material_count, 
-                           MIN(time_point) as earliest_time
-                    FROM materials 
-                    GROUP BY cycle_number 
-                    ORDER BY cycle_number
-                """)
-                return cursor.fetchall()
-        except Exception:
-            return []
+            # Errors can also surface while stepping the cursor, not only on execute
+            yield from self._connection().execute(_CYCLES_SQL)
+        except sqlite3.DatabaseError as e:
+            self._db_error = str(e)
     
     def get_element_history(self, element_name: str) -> List[Dict[str, any]]:
         """
@@ -112,32 +250,17 @@ class IterationTracker:
         Returns:
             List of dictionaries with cycle information
         """
-        if not self.db_path.exists():
+        if not self.db_path.exists() or self._db_error is not None:
             return []
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT cycle_number, total_mass_g, density_g_cm3, 
-                           helium_mass_g, time_point, case_name
-                    FROM materials 
-                    WHERE element_name = ?
-                    ORDER BY cycle_number
-                """, (element_name,))
-                
-                results = []
-                for row in cursor.fetchall():
-                    results.append({
-                        'cycle': row[0],
-                        'total_mass_g': row[1],
-                        'density_g_cm3': row[2],
-                        'helium_mass_g': row[3],
-                        'time_point': row[4],
-                        'case_name': row[5]
-                    })
-                return results
-        except Exception:
+            # Rows stream from the cursor as sqlite3.Row, whose keys are the query's column names
+            cursor = self._connection().cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(_ELEMENT_HISTORY_SQL, (element_name,))
+            return [dict(row) for row in cursor]
+        except sqlite3.DatabaseError as e:
+            self._db_error = str(e)
             return []
     
     def suggest_next_step(self) -> str:
@@ -147,48 +270,21 @@ class IterationTracker:
         Returns:
             Suggested next action as string
         """
-        status = self.get_cycle_status()
+        # Only the element count is needed here, not the element rows or an exact total
+        status = self.get_cycle_status(exact_count=False, include_elements=False)
         
         if not status['database_exists']:
-            return """
-SUGGESTED NEXT STEP:
-1. Run parseOutput.py to create initial material database from SCALE output
-   Command: python tools/parseOutput.py
-   
-This will parse the SCALE output and create the materials database.
-"""
+            return _NO_DATABASE_STEP
         
         if status.get('error'):
-            return f"""
-DATABASE ERROR: {status['error']}
-Check database integrity and fix any issues before proceeding.
-"""
+            return _DATABASE_ERROR_TMPL.format(error=status['error'])
         
         if status['latest_cycle'] is None:
-            return """
-SUGGESTED NEXT STEP:
-1. Database exists but contains no materials
-2. Run parseOutput.py to populate with initial data
-   Command: python tools/parseOutput.py
-"""
+            return _EMPTY_DATABASE_STEP
         
         latest_cycle = status['latest_cycle']
-        element_count = len(status['elements'])
-        
-        return f"""
-CURRENT STATUS: Cycle {latest_cycle} complete with {element_count} elements
-
-SUGGESTED NEXT STEP:
-1. Generate SCALE input using cycle {latest_cycle} materials:
-   Command: python generate_scale_input.py --flux-json sample_flux_data.json --power-time sample_origen_cards.txt --materials-db materials.db --cycle {latest_cycle}
-
-2. Run SCALE simulation with generated input file
-
-3. After SCALE completes, parse output for cycle {latest_cycle + 1}:
-   Command: python tools/parseOutput.py --cycle {latest_cycle + 1}
-
-4. Update flux data for next iteration (manual MCNP step)
-"""
+        return _NEXT_STEP_TMPL.format(latest=latest_cycle, next=latest_cycle + 1,
+                                      element_count=status['element_count'])
     
     def print_status(self, verbose: bool = False):
         """
@@ -197,47 +293,61 @@ SUGGESTED NEXT STEP:
         Args:
             verbose: Include detailed information
         """
-        status = self.get_cycle_status()
+        # The exact (scanning) material count and the element rows are only paid for in verbose mode
+        status = self.get_cycle_status(exact_count=verbose, include_elements=verbose)
         
-        print("=" * 60)
-        print("BURNUP ITERATION TRACKER")
-        print("=" * 60)
+        # Lines are collected and written to stdout in one call
+        lines = ["=" * 60, "BURNUP ITERATION TRACKER", "=" * 60]
         
         if not status['database_exists']:
-            print("❌ Materials database not found")
-            print(f"   Expected location: {self.db_path.absolute()}")
-            print("\n" + self.suggest_next_step())
+            lines.append("❌ Materials database not found")
+            lines.append(f"   Expected location: {self.db_path.absolute()}")
+            lines.append("\n" + self.suggest_next_step())
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
         if status.get('error'):
-            print(f"❌ Database error: {status['error']}")
+            lines.append(f"❌ Database error: {status['error']}")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
-        print(f"✅ Database found: {self.db_path}")
-        print(f"📊 Total materials: {status['total_materials']}")
+        lines.append(f"✅ Database found: {self.db_path}")
+        lines.append(f"📊 Total materials: {status['total_materials']}")
         
         if status['latest_cycle'] is not None:
-            print(f"🔄 Latest cycle: {status['latest_cycle']}")
-            print(f"🧪 Elements in latest cycle: {len(status['elements'])}")
+            lines.append(f"🔄 Latest cycle: {status['latest_cycle']}")
+            lines.append(f"🧪 Elements in latest cycle: {status['element_count']}")
             
             if verbose and status['elements']:
-                print("\nELEMENT DETAILS:")
-                for element_name, case_name, total_mass in status['elements']:
-                    print(f"  {element_name:<15} ({case_name:<20}) {total_mass:8.3f}g")
+                lines.append("\nELEMENT DETAILS:")
+                lines.extend(f"  {element_name:<15} ({case_name:<20}) {total_mass:8.3f}g"
+                             for element_name, case_name, total_mass in status['elements'])
         else:
-            print("🔄 No cycles found in database")
+            lines.append("🔄 No cycles found in database")
         
         if verbose:
-            cycles = self.list_all_cycles()
-            if cycles:
-                print(f"\nCYCLE HISTORY ({len(cycles)} cycles):")
-                for cycle, count, time_point in cycles:
-                    print(f"  Cycle {cycle:2d}: {count:2d} materials (time: {time_point})")
+            # Rows stream into the output; the header is filled in once they are counted
+            header_index = len(lines)
+            lines.append(None)
+            lines.extend(f"  Cycle {cycle:2d}: {count:2d} materials (time: {time_point})"
+                         for cycle, count, time_point in self.iter_cycles())
+            cycle_count = len(lines) - header_index - 1
+            if cycle_count:
+                lines[header_index] = f"\nCYCLE HISTORY ({cycle_count} cycles):"
+            else:
+                del lines[header_index]
         
-        print("\n" + self.suggest_next_step())
+        lines.append("\n" + self.suggest_next_step())
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main command line interface."""
+    # Bare invocation (the common case) shows the default status without loading argparse
+    if len(sys.argv) == 1:
+        IterationTracker('materials.db').print_status()
+        return
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description="Track burnup iteration progress",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -291,14 +401,15 @@ Examples:
                   f"(He: {entry['helium_mass_g']:8.6f}g, ρ: {entry['density_g_cm3']:.3f}g/cm³)")
     
     elif args.cycles:
-        cycles = tracker.list_all_cycles()
-        if not cycles:
+        cycles = tracker.iter_cycles()
+        first = next(cycles, None)
+        if first is None:
             print("No cycles found in database")
             return
         
         print("ALL CYCLES")
         print("=" * 40)
-        for cycle, count, time_point in cycles:
+        for cycle, count, time_point in itertools.chain((first,), cycles):
             print(f"Cycle {cycle:2d}: {count:2d} materials (time: {time_point})")
     
     else:
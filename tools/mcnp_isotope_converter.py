@@ -7,17 +7,15 @@ Now uses mendeleev library for comprehensive isotope data.
 """
 
 import argparse
+import functools
+import importlib.metadata
+import itertools
 import json
+import os
+import re
 import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
-try:
-    from mendeleev import element
-except ImportError:
-    print("Error: mendeleev package not installed")
-    print("Install with: pip install mendeleev")
-    sys.exit(1)
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 
 # Custom Exceptions
@@ -46,6 +44,11 @@ class IsotopeNotAvailableError(MCNPConverterError):
     pass
 
 
+class MendeleevNotInstalledError(LibraryDataError):
+    """Raised when the isotope table has to be built but mendeleev is not installed."""
+    pass
+
+
 # Constants
 DEFAULT_LIBRARY_SUFFIX = ".00c"
 SUPPORTED_LIBRARIES = [".00c", ".70c", ".31c"]
@@ -62,10 +65,14 @@ LIBRARY_DESCRIPTIONS = {
 MAX_ATOMIC_NUMBER = 118
 ZAID_MULTIPLIER = 1000  # For converting Z to elemental ZAID (Z000)
 MCNP_CONTINUATION_INDENT = "     "  # 5 spaces for MCNP continuation lines
+ISOTOPE_TABLE_FILE = "isotope_table.json"  # Natural isotope data extracted from mendeleev, next to this script
 
+# ZAID token, optionally with a library suffix (e.g. 1001, 1001.00c); group 1 is the ZAID
+_ZAID_RE = re.compile(r'(\d+)(?:\.\S*)?$')
+_NOT_LOADED = object()  # elements_db miss marker (None is a cached "no natural isotopes" result)
 
-@dataclass
-class Isotope:
+
+class Isotope(NamedTuple):
     """Represents a single isotope"""
     zaid: int  # ZZZAAA format (e.g., 92235 for U-235)
     abundance: float  # Natural abundance (fraction, not percentage)
@@ -74,12 +81,125 @@ class Isotope:
 @dataclass
 class Element:
     """Represents an element with its isotopes"""
+    __slots__ = ('symbol', 'z_number', 'name', 'isotopes')  # isotopes is replaced by set_custom_isotopes
     symbol: str
     z_number: int
     name: str
     isotopes: List[Isotope]
 
 
+def _mendeleev_version() -> Optional[str]:
+    """Installed mendeleev version, read from package metadata without importing it (None if absent)"""
+    try:
+        return importlib.metadata.version('mendeleev')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _build_isotope_table() -> Tuple[Dict[int, Tuple[str, str, Tuple[Tuple[int, float], ...]]], Dict[int, str]]:
+    """
+    Extract (symbol, name, ((mass_number, abundance fraction), ...)) for Z=1-118 from mendeleev.
+    
+    mendeleev (and SQLAlchemy behind it) is imported only here, so conversions served from
+    the cached table never load it. Returns (table, errors), where errors maps the atomic
+    numbers that could not be read to "(symbol): error" descriptions.
+    
+    Raises:
+        MendeleevNotInstalledError: If mendeleev cannot be imported
+    """
+    try:
+        from mendeleev import element
+    except ImportError as e:
+        raise MendeleevNotInstalledError("mendeleev package not installed") from e
+    
+    table = {}
+    errors = {}
+    for z_number in range(1, MAX_ATOMIC_NUMBER + 1):
+        elem = None
+        try:
+            elem = element(z_number)
+            # Natural isotopes only, abundance converted from percentage to fraction
+            isotopes = tuple(
+                (isotope.mass_number, isotope.abundance / 100.0)
+                for isotope in elem.isotopes
+                if isotope.abundance is not None and isotope.abundance > 0
+            )
+            table[z_number] = (elem.symbol, elem.name, isotopes)
+        except (AttributeError, ValueError, KeyError, TypeError) as e:
+            # Left out of the table; _load_element reports the error
+            elem_symbol = getattr(elem, 'symbol', 'unknown')
+            errors[z_number] = f"({elem_symbol}): {e}"
+    return table, errors
+
+
+@functools.lru_cache(maxsize=1)
+def _isotope_table() -> Tuple[Dict[int, Tuple[str, str, Tuple[Tuple[int, float], ...]]], Dict[int, str]]:
+    """
+    Return the natural isotope table and its build errors, from the JSON sidecar when current.
+    
+    The first run without the sidecar queries mendeleev once per element and writes the
+    sidecar; after that a lookup is a dict access instead of a database query. The sidecar
+    records the mendeleev version it was built from and is rebuilt when the installed
+    version differs. A table with any element errors is not saved, so those elements are
+    retried (and their errors reported) on the next run.
+    """
+    table_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ISOTOPE_TABLE_FILE)
+    version = _mendeleev_version()
+    try:
+        with open(table_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Without mendeleev installed, any existing table is the best data available
+        if version is None or data['mendeleev_version'] == version:
+            return {
+                int(z): (symbol, name, tuple((mass, abundance) for mass, abundance in isotopes))
+                for z, (symbol, name, isotopes) in data['elements'].items()
+            }, {}
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    table, errors = _build_isotope_table()
+    if not errors:
+        # Written beside the target and renamed over it, so concurrent runs never read a partial file
+        tmp_file = f"{table_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'mendeleev_version': version, 'elements': table}, f)
+            os.replace(tmp_file, table_file)
+        except OSError:
+            # Read-only install: rebuild next time
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    return table, errors
+
+
+@functools.lru_cache(maxsize=None)
+def _load_available(lib_suffix: str) -> Optional[FrozenSet[int]]:
+    """
+    Read the ZAIDs listed in a library's isotope file, once per process.
+    
+    Returns None when the file does not exist. Read/parse errors propagate (and are not cached).
+    """
+    isotope_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ISOTOPE_FILE_MAP[lib_suffix])
+    if not os.path.exists(isotope_file):
+        return None
+    with open(isotope_file, 'r', encoding='utf-8') as f:
+        return frozenset(json.load(f).get("isotopes", []))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(material_card: str) -> Tuple[Tuple[Tuple[int, float], ...], Tuple[Tuple[int, str], ...]]:
+    """
+    Parse a material card once per distinct card text.
+    
+    Parsing does not depend on converter settings, so the result is shared across
+    instances. Returns immutable (materials, comment items); errors are not cached.
+    """
+    materials, comments = MCNPMaterialConverter.parse_material_card(material_card)
+    return tuple(materials), tuple(comments.items())
+
+
 class MCNPMaterialConverter:
     """
     MCNP Material Converter: Converts elemental material definitions to isotopic forms.
@@ -152,12 +272,16 @@ class MCNPMaterialConverter:
         self.library_suffix = library_suffix
         self.use_nlib = use_nlib
         self.verbose = verbose
-        self.elements_db = {}  # Load elements on demand
+        self.elements_db = {}  # Load elements on demand (None for elements with no natural isotopes)
+        self._weight_cache: Dict[int, Tuple[Tuple[int, float], ...]] = {}  # Z -> normalized isotope weights
+        self._warned = set()  # Z numbers already warned about unavailable isotopes
         self.available_isotopes = self._initialize_available_isotopes()
+        # An empty set for the current library means "no library data": every isotope is available
+        self._filter_enabled = bool(self.available_isotopes[self.library_suffix])
         
     def _load_element(self, z_number: int) -> Optional[Element]:
         """
-        Load element data from mendeleev on demand.
+        Load element data from the cached mendeleev isotope table on demand.
         
         Args:
             z_number: Atomic number (must be 1-118)
@@ -174,83 +298,73 @@ class MCNPMaterialConverter:
                 f"Invalid atomic number: {z_number}. Must be integer between 1-{MAX_ATOMIC_NUMBER}"
             )
         
-        # Return cached element if available
-        if z_number in self.elements_db:
-            return self.elements_db[z_number]
+        # Return cached element (or cached None) if available
+        element = self.elements_db.get(z_number, _NOT_LOADED)
+        if element is not _NOT_LOADED:
+            return element
         
-        try:
-            elem = element(z_number)
-            isotopes = []
-            
-            # Get all natural isotopes from mendeleev
-            for isotope in elem.isotopes:
-                if isotope.abundance is not None and isotope.abundance > 0:
-                    # Create ZAID in MCNP format (ZZZAAA)
-                    zaid = z_number * ZAID_MULTIPLIER + isotope.mass_number
-                    # Convert abundance from percentage to fraction
-                    abundance = isotope.abundance / 100.0
-                    isotopes.append(Isotope(zaid, abundance))
-            
-            # Only add element if it has natural isotopes
-            if isotopes:
-                self.elements_db[z_number] = Element(
-                    elem.symbol,
-                    z_number,
-                    elem.name,
-                    isotopes
-                )
-                return self.elements_db[z_number]
-            else:
-                # Element exists but has no natural isotopes (e.g., Tc, Pm, Pu, Am, Cm)
-                # Users must specify these in isotopic form directly
-                return None
-
-        except (AttributeError, ValueError, KeyError, TypeError) as e:
-            # Capture element symbol if we got that far
-            elem_symbol = elem.symbol if 'elem' in dir() and hasattr(elem, 'symbol') else 'unknown'
+        table, errors = _isotope_table()
+        entry = table.get(z_number)
+        if entry is None:
             raise ElementNotFoundError(
-                f"Could not load element data for Z={z_number} ({elem_symbol}): {e}"
+                f"Could not load element data for Z={z_number} "
+                f"{errors.get(z_number, '(unknown): not in isotope table')}"
+            )
+        symbol, name, natural_isotopes = entry
+        
+        # Only build an element if it has natural isotopes
+        if natural_isotopes:
+            # Create ZAIDs in MCNP format (ZZZAAA)
+            element = Element(
+                symbol,
+                z_number,
+                name,
+                [Isotope(z_number * ZAID_MULTIPLIER + mass_number, abundance)
+                 for mass_number, abundance in natural_isotopes]
             )
+        else:
+            # Element exists but has no natural isotopes (e.g., Tc, Pm, Pu, Am, Cm)
+            # Users must specify these in isotopic form directly
+            element = None
+        
+        self.elements_db[z_number] = element
+        return element
     
-    def _initialize_available_isotopes(self) -> Dict[str, List[int]]:
+    def _initialize_available_isotopes(self) -> Dict[str, FrozenSet[int]]:
         """
         Initialize available isotopes for different libraries.
-        Loads from configuration files when available.
+        Loads from configuration files when available (parsed once per process).
         
         Returns:
-            Dictionary mapping library suffixes to lists of available isotope ZAIDs
+            Dictionary mapping library suffixes to frozensets of available isotope ZAIDs
+            (empty when the library file is missing)
             
         Raises:
             LibraryDataError: If critical library files cannot be loaded
         """
-        import os
-        
-        # Initialize with empty lists for all supported libraries
-        available = {lib: [] for lib in SUPPORTED_LIBRARIES}
-        
-        script_dir = os.path.dirname(os.path.abspath(__file__))
+        # Initialize with empty sets for all supported libraries
+        available = {lib: frozenset() for lib in SUPPORTED_LIBRARIES}
         
         # Try to load isotope data files for each library
         for lib_suffix in SUPPORTED_LIBRARIES:
             if lib_suffix in ISOTOPE_FILE_MAP:
-                isotope_file = os.path.join(script_dir, ISOTOPE_FILE_MAP[lib_suffix])
+                try:
+                    isotopes = _load_available(lib_suffix)
+                except (json.JSONDecodeError, IOError) as e:
+                    # For current library, this is critical; for others, just warn
+                    if lib_suffix == self.library_suffix:
+                        raise LibraryDataError(
+                            f"Could not load critical isotope data for {lib_suffix}: {e}"
+                        )
+                    elif self.verbose:
+                        print(f"Warning: Could not load isotope data for {lib_suffix}: {e}")
+                    continue
                 
-                if os.path.exists(isotope_file):
-                    try:
-                        with open(isotope_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            available[lib_suffix] = data.get("isotopes", [])
-                            if self.verbose:
-                                lib_name = LIBRARY_DESCRIPTIONS.get(lib_suffix, lib_suffix)
-                                print(f"Loaded {len(available[lib_suffix])} isotopes for {lib_name}")
-                    except (json.JSONDecodeError, IOError) as e:
-                        # For current library, this is critical; for others, just warn
-                        if lib_suffix == self.library_suffix:
-                            raise LibraryDataError(
-                                f"Could not load critical isotope data for {lib_suffix}: {e}"
-                            )
-                        elif self.verbose:
-                            print(f"Warning: Could not load isotope data for {lib_suffix}: {e}")
+                if isotopes is not None:
+                    available[lib_suffix] = isotopes
+                    if self.verbose:
+                        lib_name = LIBRARY_DESCRIPTIONS.get(lib_suffix, lib_suffix)
+                        print(f"Loaded {len(isotopes)} isotopes for {lib_name}")
                 else:
                     # Missing file for current library is just a warning (will use all isotopes)
                     if lib_suffix == self.library_suffix and self.verbose:
@@ -259,7 +373,8 @@ class MCNPMaterialConverter:
         
         return available
     
-    def parse_material_card(self, material_card: str) -> Tuple[List[Tuple[int, float]], Dict[int, str]]:
+    @staticmethod
+    def parse_material_card(material_card: str) -> Tuple[List[Tuple[int, float]], Dict[int, str]]:
         """
         Parse an MCNP material card to extract ZAIDs, fractions, and comments.
         
@@ -281,8 +396,30 @@ class MCNPMaterialConverter:
         
         materials = []
         comments = {}
-        lines = material_card.strip().split('\n')
+        stream = MCNPMaterialConverter.parse_material_card_stream(material_card.strip().split('\n'))
+        for zaid, fraction, comment in stream:
+            materials.append((zaid, fraction))
+            
+            # Associate comment with this ZAID if present
+            if comment:
+                comments[zaid] = comment
+        
+        return materials, comments
+    
+    @staticmethod
+    def parse_material_card_stream(lines: Iterable[str]) -> Iterator[Tuple[int, float, str]]:
+        """
+        Parse an MCNP material card one line at a time (e.g. straight from a file object).
         
+        Args:
+            lines: Iterable of card lines (trailing newlines are fine)
+            
+        Yields:
+            (ZAID, fraction, inline comment) tuples; comment is "" when absent
+            
+        Raises:
+            InvalidMaterialCardError: If material card format is invalid
+        """
         # Check if we have at least one material definition line
         has_material_data = False
         
@@ -299,159 +436,175 @@ class MCNPMaterialConverter:
                 comment = parts[1].strip()
             
             # Parse ZAID and fraction pairs
-            tokens = line.split()
-            i = 0
+            tokens = iter(line.split())
             
-            while i < len(tokens):
-                if tokens[i].startswith('m'):
-                    # Skip material card number
-                    i += 1
-                    continue
-                
-                # Skip non-ZAID tokens (like 'nlib=00c' or other keywords)
-                token = tokens[i]
-                if '=' in token or token.isalpha():
-                    i += 1
+            for token in tokens:
+                # Skip the material card number, keywords (like 'nlib=00c') and malformed tokens
+                match = _ZAID_RE.match(token)
+                if match is None:
                     continue
 
-                try:
-                    # Try to parse as ZAID - must start with digits
-                    if not token[0].isdigit():
-                        i += 1
-                        continue
-                    # Parse ZAID (might have library suffix)
-                    zaid_str = tokens[i]
-                    if '.' in zaid_str:
-                        zaid = int(zaid_str.split('.')[0])
-                    else:
-                        zaid = int(zaid_str)
-                    
-                    # Validate ZAID format
-                    if zaid <= 0 or zaid > 999999:
-                        raise InvalidMaterialCardError(
-                            f"Invalid ZAID {zaid} on line {line_num}. Must be positive integer ≤ 999999"
-                        )
-                    
-                    # Parse fraction
-                    if i + 1 < len(tokens):
-                        try:
-                            fraction = float(tokens[i + 1])
-                        except ValueError:
-                            raise InvalidMaterialCardError(
-                                f"Invalid fraction '{tokens[i + 1]}' for ZAID {zaid} on line {line_num}"
-                            )
-                    else:
-                        fraction = 1.0
-                    
-                    # Validate fraction is not zero (MCNP doesn't allow zero fractions)
-                    if fraction == 0.0:
+                # Parse ZAID (might have library suffix)
+                zaid = int(match.group(1))
+                
+                # Validate ZAID format
+                if zaid <= 0 or zaid > 999999:
+                    raise InvalidMaterialCardError(
+                        f"Invalid ZAID {zaid} on line {line_num}. Must be positive integer ≤ 999999"
+                    )
+                
+                # Parse fraction (consumes the next token)
+                fraction_str = next(tokens, None)
+                if fraction_str is not None:
+                    try:
+                        fraction = float(fraction_str)
+                    except ValueError:
                         raise InvalidMaterialCardError(
-                            f"Zero fraction not allowed for ZAID {zaid} on line {line_num}"
+                            f"Invalid fraction '{fraction_str}' for ZAID {zaid} on line {line_num}"
                         )
-                    
-                    materials.append((zaid, fraction))
-                    has_material_data = True
-                    
-                    # Associate comment with this ZAID if present
-                    if comment:
-                        comments[zaid] = comment
-                    
-                    i += 2
-                    
-                except (ValueError, IndexError) as e:
-                    if "Invalid" in str(e):
-                        raise  # Re-raise our custom validation errors
-                    # Skip malformed tokens but continue parsing
-                    i += 1
+                else:
+                    fraction = 1.0
+                
+                # Validate fraction is not zero (MCNP doesn't allow zero fractions)
+                if fraction == 0.0:
+                    raise InvalidMaterialCardError(
+                        f"Zero fraction not allowed for ZAID {zaid} on line {line_num}"
+                    )
+                
+                has_material_data = True
+                yield zaid, fraction, comment
         
         # Validate that we found at least one material
         if not has_material_data:
             raise InvalidMaterialCardError("No valid material data found in material card")
-        
-        return materials, comments
     
-    def convert_element_to_isotopes(self, z_number: int, fraction: float) -> List[Tuple[int, float]]:
+    def _element_isotope_weights(self, z_number: int) -> Tuple[Tuple[int, float], ...]:
         """
-        Convert an elemental ZAID to its isotopic components.
+        Get the isotope breakdown of an element, renormalized over the isotopes
+        available in the current library. Computed once per Z and cached.
 
         Args:
             z_number: Atomic number (Z)
-            fraction: Material fraction for this element
 
         Returns:
-            List of (isotope_ZAID, adjusted_fraction) tuples
+            Tuple of (isotope_ZAID, weight) tuples
+
+        Raises:
+            ValueError: If the element has no natural isotopes
         """
+        weights = self._weight_cache.get(z_number)
+        if weights is not None:
+            return weights
+
         # Load element data on demand
         elem_data = self._load_element(z_number)
         if not elem_data:
             # Get element symbol for better error message
-            try:
-                elem_info = element(z_number)
-                symbol = elem_info.symbol
-            except Exception:
-                symbol = f"Z={z_number}"
+            entry = _isotope_table()[0].get(z_number)
+            symbol = entry[0] if entry else f"Z={z_number}"
             raise ValueError(
                 f"Element {symbol} (Z={z_number}) has no natural isotopes. "
                 f"Synthetic elements must be specified in isotopic form (e.g., {z_number}239 not {z_number}000)."
             )
-        isotopes = []
+        # Split isotopes by availability and total the available abundance in one pass
+        available = []
         unavailable = []
-
-        # Check which isotopes are available in the library
-        available_in_lib = self.available_isotopes.get(self.library_suffix, [])
-
         total_available_abundance = 0.0
-        for isotope in elem_data.isotopes:
-            # If no library data loaded (empty list), include all isotopes
-            # Otherwise, only include isotopes that are in the library
-            if len(available_in_lib) == 0 or isotope.zaid in available_in_lib:
+        if self._filter_enabled:
+            # Only include isotopes that are in the library
+            available_in_lib = self.available_isotopes[self.library_suffix]
+            for isotope in elem_data.isotopes:
+                zaid = isotope.zaid
+                if zaid in available_in_lib:
+                    abundance = isotope.abundance
+                    available.append((zaid, abundance))
+                    total_available_abundance += abundance
+                else:
+                    unavailable.append(zaid)
+        else:
+            # No library data loaded, include all isotopes
+            for isotope in elem_data.isotopes:
+                available.append((isotope.zaid, isotope.abundance))
                 total_available_abundance += isotope.abundance
-            else:
-                unavailable.append(isotope.zaid)
+
+        if unavailable and self.verbose and z_number not in self._warned:
+            self._warned.add(z_number)
+            print(f"Warning: Isotopes {unavailable} for element {elem_data.symbol} not available in {self.library_suffix}")
+            print(f"         Abundances renormalized over available isotopes")
 
         # Renormalize abundances if some isotopes are unavailable
-        for isotope in elem_data.isotopes:
-            if len(available_in_lib) == 0 or isotope.zaid in available_in_lib:
-                # Calculate the fraction for this isotope
-                if total_available_abundance > 0:
-                    # Renormalize to account for missing isotopes
-                    renormalized_abundance = isotope.abundance / total_available_abundance
-                    isotope_fraction = fraction * renormalized_abundance
-                else:
-                    isotope_fraction = fraction * isotope.abundance
+        if total_available_abundance > 0:
+            weights = tuple((zaid, abundance / total_available_abundance) for zaid, abundance in available)
+        else:
+            weights = tuple(available)
+        self._weight_cache[z_number] = weights
+        return weights
 
-                if isotope_fraction != 0:  # Include all isotopes except exactly zero
-                    isotopes.append((isotope.zaid, isotope_fraction))
+    def convert_element_to_isotopes(self, z_number: int, fraction: float) -> List[Tuple[int, float]]:
+        """
+        Convert an elemental ZAID to its isotopic components.
 
-        if unavailable and self.verbose:
-            print(f"Warning: Isotopes {unavailable} for element {elem_data.symbol} not available in {self.library_suffix}")
-            print(f"         Abundances renormalized over available isotopes")
+        Args:
+            z_number: Atomic number (Z)
+            fraction: Material fraction for this element
+
+        Returns:
+            List of (isotope_ZAID, adjusted_fraction) tuples
+        """
+        # Include all isotopes except exactly zero
+        isotopes = [(zaid, fraction * weight) for zaid, weight in self._element_isotope_weights(z_number)
+                    if fraction * weight != 0]
 
         if not isotopes:
             raise ValueError(f"No isotopes available for element Z={z_number} in library {self.library_suffix}")
         
         return isotopes
     
-    def convert_material(self, material_card: str, handle_missing: str = "warn") -> str:
+    def convert_material(self, material_card: Union[str, Iterable[str]], handle_missing: str = "warn") -> str:
         """
         Convert an MCNP material card from elemental to isotopic form.
         
         Args:
-            material_card: The original material card
+            material_card: The original material card, or an iterable of its lines
+                (e.g. an open file) which is parsed as it is read
             handle_missing: How to handle missing isotopes ("warn", "skip", "error")
             
         Returns:
             Converted material card string
         """
-        materials, original_comments = self.parse_material_card(material_card)
+        if isinstance(material_card, str):
+            materials, comment_items = _parse_cached(material_card)
+            original_comments = dict(comment_items)
+            first_line = material_card.strip()
+        else:
+            try:
+                lines = iter(material_card)
+            except TypeError:
+                raise InvalidMaterialCardError("Material card must be a string") from None
+            
+            # Find the first non-blank line (it holds the material number, if any)
+            first_line = ""
+            for line in lines:
+                if line.strip():
+                    first_line = line.strip()
+                    break
+            if not first_line:
+                raise InvalidMaterialCardError("Material card cannot be empty")
+            
+            materials = []
+            original_comments = {}
+            for zaid, fraction, comment in self.parse_material_card_stream(itertools.chain((line,), lines)):
+                materials.append((zaid, fraction))
+                if comment:
+                    original_comments[zaid] = comment
         converted = []
         converted_comments = {}
         warnings = []
         
         # Extract material number if present
         mat_num = ""
-        if material_card.strip().startswith('m'):
-            mat_num = material_card.strip().split()[0] + " "
+        if first_line.startswith('m'):
+            mat_num = first_line.split()[0] + " "
         
         for zaid, fraction in materials:
             # Check if this is an elemental form (Z000)
@@ -491,33 +644,24 @@ class MCNPMaterialConverter:
                     converted_comments[zaid] = original_comments[zaid]
         
         # Format output - one isotope per line with comments
-        output_lines = [mat_num]
-        for i, (zaid, fraction) in enumerate(converted):
-            if i > 0:
-                output_lines.append(f"\n{MCNP_CONTINUATION_INDENT}")
-
+        suffix = "" if self.use_nlib else self.library_suffix  # nlib format leaves ZAIDs bare
+        parts = []
+        for zaid, fraction in converted:
             # Add comment if available
-            comment_str = ""
-            if zaid in converted_comments:
-                comment_str = f" $ {converted_comments[zaid]}"
-
-            # Format ZAID with or without suffix
-            if self.use_nlib:
-                output_lines.append(f"{zaid} {fraction:.6e}{comment_str}")
+            comment = converted_comments.get(zaid)
+            if comment is not None:
+                parts.append(f"{zaid}{suffix} {fraction:.6e} $ {comment}")
             else:
-                output_lines.append(f"{zaid}{self.library_suffix} {fraction:.6e}{comment_str}")
+                parts.append(f"{zaid}{suffix} {fraction:.6e}")
+
+        result = mat_num + f"\n{MCNP_CONTINUATION_INDENT}".join(parts)
 
         # Add nlib directive if using nlib format
         if self.use_nlib:
-            nlib_suffix = self.library_suffix[1:]  # Remove the dot
-            result = "".join(output_lines) + f"\n{MCNP_CONTINUATION_INDENT}nlib={nlib_suffix}"
-        else:
-            result = "".join(output_lines)
+            result += f"\n{MCNP_CONTINUATION_INDENT}nlib={self.library_suffix[1:]}"  # Remove the dot
         
         if warnings:
-            result += "\nc Warnings during conversion:\n"
-            for warning in warnings:
-                result += f"c   {warning}\n"
+            result += "\nc Warnings during conversion:\n" + "\n".join(f"c   {warning}" for warning in warnings)
         
         return result.strip()
     
@@ -529,12 +673,13 @@ class MCNPMaterialConverter:
             z_number: Atomic number
             isotopes: List of (ZAID, abundance) tuples
         """
-        if z_number not in self.elements_db:
+        if self.elements_db.get(z_number) is None:
             self.elements_db[z_number] = Element("Custom", z_number, f"Element-{z_number}", [])
         
         self.elements_db[z_number].isotopes = [
             Isotope(zaid, abundance) for zaid, abundance in isotopes
         ]
+        self._weight_cache.pop(z_number, None)
 
 
 def main():
@@ -581,20 +726,14 @@ Examples:
         use_nlib=args.use_nlib
     )
     
-    # Read input
-    if args.input:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            material_card = f.read()
-    else:
-        print("Enter material card (Ctrl+D when done):", file=sys.stderr)
-        material_card = sys.stdin.read()
-
-    # Convert
+    # Read and convert, parsing the input line by line as it is read
     try:
-        converted = converter.convert_material(
-            material_card,
-            handle_missing=args.handle_missing
-        )
+        if args.input:
+            with open(args.input, 'r', encoding='utf-8') as f:
+                converted = converter.convert_material(f, handle_missing=args.handle_missing)
+        else:
+            print("Enter material card (Ctrl+D when done):", file=sys.stderr)
+            converted = converter.convert_material(sys.stdin, handle_missing=args.handle_missing)
 
         # Write output
         if args.output:
@@ -604,6 +743,10 @@ Examples:
         else:
             print(converted)
             
+    except MendeleevNotInstalledError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        print("Install with: pip install mendeleev", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -7,14 +7,18 @@ and displaying a status dashboard.
 """
 
 import os
+import re
 import sys
 import time
 import json
+import fnmatch
 import argparse
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
 # Import our custom modules
@@ -28,22 +32,109 @@ except ImportError:
         sys.path.insert(0, str(tools_dir))
     from scale_msg_parser import ScaleMsgParser
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speedup; falls back to stdlib json
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None  # No change notifications, poll every refresh interval
+
+# Statuses a job never leaves once its .msg file reports them
+TERMINAL_STATUSES = frozenset({'completed', 'failed'})
+
+# With change notifications, redraw at least this often so the dashboard stays current
+HEARTBEAT_SECONDS = 60
+
+@functools.lru_cache(maxsize=4096)
+def format_time(seconds: Optional[float]) -> str:
+    """Format time duration"""
+    if seconds is None:
+        return "N/A"
+    
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    elif seconds < 3600:
+        return f"{seconds/60:.1f}m"
+    else:
+        return f"{seconds/3600:.1f}h"
+
+@functools.lru_cache(maxsize=4096)
+def format_size(bytes_size: int) -> str:
+    """Format file size"""
+    if bytes_size < 1024:
+        return f"{bytes_size}B"
+    elif bytes_size < 1024*1024:
+        return f"{bytes_size/1024:.1f}KB"
+    else:
+        return f"{bytes_size/(1024*1024):.1f}MB"
+
+class DirectoryChanges:
+    """Watchdog event handler that records which job files in the directory changed"""
+    
+    # Event types that mean file contents or the directory listing changed
+    # (opens and read-only closes come from our own .msg reads)
+    CHANGE_EVENTS = frozenset({'created', 'deleted', 'modified', 'moved', 'closed'})
+    
+    def __init__(self):
+        self._changed = threading.Event()
+        self._lock = threading.Lock()
+        self._stems = set()  # File names without extension, i.e. job names
+    
+    def dispatch(self, event):
+        """Called on the watchdog observer thread for every filesystem event"""
+        if event.is_directory or event.event_type not in self.CHANGE_EVENTS:
+            return
+        with self._lock:
+            for path in (event.src_path, getattr(event, 'dest_path', '')):
+                if path:
+                    self._stems.add(os.path.splitext(os.path.basename(os.fsdecode(path)))[0])
+        self._changed.set()
+    
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Wait up to timeout seconds for a change.
+        
+        Returns:
+            Job names whose files changed, or None if nothing changed before the timeout
+        """
+        if not self._changed.wait(timeout):
+            return None
+        with self._lock:
+            self._changed.clear()
+            stems, self._stems = self._stems, set()
+        return stems
+
 class ScaleJobMonitor:
     """Monitor SCALE jobs in a directory and display status"""
     
-    def __init__(self, directory: Path, refresh_interval: int = 5):
+    def __init__(self, directory: Path, refresh_interval: int = 5, ascii_mode: bool = False):
         """
         Initialize job monitor
         
         Args:
             directory: Directory to monitor for SCALE jobs
             refresh_interval: Seconds between status refreshes
+            ascii_mode: Use single-column ASCII status symbols instead of emoji
         """
         self.directory = Path(directory)
         self.refresh_interval = refresh_interval
+        self._ascii_mode = ascii_mode
         self.msg_parser = ScaleMsgParser()
         self.stop_monitoring = False
         self.element_mapping = None  # Will load from JSON if available
+        self._assembly_count = 0  # Derived from element_mapping by load_element_mapping
+        self._filename_to_assembly = {}
+        self._filename_to_element_number = {}
+        self._msg_cache = {}  # msg path -> (st_mtime_ns, st_size, .out key, parsed msg data, tail read state)
+        self._jobs = {}  # inp file name -> job status record, kept between refreshes
+        self._parse_pool = None  # Thread pool for parsing changed .msg files, created on first use
+        self._pattern = None  # Input file pattern and its compiled matcher, set by _scan_jobs
+        self._pattern_match = None
+        self._last_frame_hash = None  # Hash of the last dashboard written (excluding its timestamp)
+        self._last_frame_time = 0.0
         
         # Terminal control sequences
         self.CLEAR_SCREEN = '\033[2J\033[H'
@@ -58,21 +149,172 @@ class ScaleJobMonitor:
             'BOLD': '\033[1m',
             'END': '\033[0m'
         }
+        
+        # Per-status row format templates (job list row, grouped element row)
+        self._row_templates = {}
+        for status in ('not_started', 'running', 'completed', 'failed', 'error'):
+            self._status_templates(status)
     
-    def find_jobs(self, pattern: str = "assembly_*.inp") -> List[Path]:
-        """Find all input files in the directory"""
-        inp_files = list(self.directory.glob(pattern))
-        return sorted(inp_files)
+    def _scan_jobs(self, pattern: str = "assembly_*.inp", changed_stems: Optional[Set[str]] = None) -> List[Dict]:
+        """
+        Find input files matching pattern and get status data for each job.
+        
+        The directory is listed once; the .msg/.out companions and all file sizes
+        come from that listing instead of per-file exists()/stat() calls.
+        
+        Args:
+            pattern: Glob pattern for input file names
+            changed_stems: Job names whose files changed since the last scan; other
+                jobs keep their previous record. None refreshes every job.
+        """
+        if pattern != self._pattern:
+            # Case-insensitive where the filesystem is (Windows), like Path.glob
+            flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+            self._pattern_match = re.compile(fnmatch.translate(pattern), flags).match
+            self._pattern = pattern
+        pattern_match = self._pattern_match
+        
+        entries_by_name = {}
+        inp_entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    entries_by_name[entry.name] = entry
+                    if pattern_match(entry.name):
+                        inp_entries.append((Path(entry.path), entry))
+        except (FileNotFoundError, NotADirectoryError):
+            # Directory not created yet (or removed): no jobs, as with Path.glob
+            self._jobs = {}
+            self._msg_cache = {}
+            return []
+        inp_entries.sort(key=lambda item: item[0])
+        
+        jobs = {}
+        msg_cache = {}  # Rebuilt each scan so jobs that disappear are dropped
+        to_parse = []  # (job_info, msg_file, msg_stat, .out key, tail state) for changed jobs
+        
+        for inp_file, inp_entry in inp_entries:
+            stem = os.path.splitext(inp_entry.name)[0]
+            
+            # Unchanged job: keep its record (and cached .msg parse) as is
+            if changed_stems is not None and stem not in changed_stems:
+                job_info = self._jobs.get(inp_entry.name)
+                if job_info is not None:
+                    jobs[inp_entry.name] = job_info
+                    cached = self._msg_cache.get(job_info['msg_file'])
+                    if cached is not None:
+                        msg_cache[job_info['msg_file']] = cached
+                    continue
+            
+            msg_entry = entries_by_name.get(stem + '.msg')
+            out_entry = entries_by_name.get(stem + '.out')
+            msg_file = inp_file.with_name(stem + '.msg')
+            msg_stat = msg_entry.stat() if msg_entry is not None else None
+            out_stat = out_entry.stat() if out_entry is not None else None
+            # The status also depends on the .out summary, so its changes invalidate the parse too
+            out_key = (out_stat.st_mtime_ns, out_stat.st_size) if out_stat is not None else None
+            
+            job_info = {
+                'name': inp_file.stem,
+                'inp_file': inp_file,
+                'msg_file': msg_file,
+                'out_file': inp_file.with_name(stem + '.out'),
+                'status': 'not_started',
+                'return_code': None,
+                'runtime_seconds': None,
+                'start_time': None,
+                'finish_time': None,
+                'last_update': None,
+                'file_sizes': {
+                    'inp': inp_entry.stat().st_size,
+                    'msg': msg_stat.st_size if msg_stat is not None else 0,
+                    'out': out_stat.st_size if out_stat is not None else 0
+                }
+            }
+            
+            # Parse .msg file if it exists
+            if msg_stat is not None:
+                # Reuse the previous parse while the .msg and .out files are unchanged;
+                # finished jobs only need the same .msg size (a touched mtime doesn't matter)
+                cached = self._msg_cache.get(msg_file)
+                if (cached is not None and cached[1] == msg_stat.st_size and cached[2] == out_key
+                        and (cached[0] == msg_stat.st_mtime_ns
+                             or cached[3]['status'] in TERMINAL_STATUSES)):
+                    msg_cache[msg_file] = (msg_stat.st_mtime_ns, msg_stat.st_size, out_key, cached[3], cached[4])
+                    self._apply_msg_data(job_info, cached[3])
+                else:
+                    # A grown (or, when only the .out changed, untouched) file is only read
+                    # from where the last read stopped; anything else is read from the start
+                    tail = None
+                    if cached is not None and (msg_stat.st_size > cached[1]
+                                               or (msg_stat.st_size == cached[1]
+                                                   and msg_stat.st_mtime_ns == cached[0])):
+                        tail = cached[4]
+                    to_parse.append((job_info, msg_file, msg_stat, out_key, tail))
+            
+            jobs[inp_entry.name] = job_info
+        
+        # Parse the changed .msg files, in parallel when there are several
+        if len(to_parse) > 1:
+            if self._parse_pool is None:
+                self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+            futures = [self._parse_pool.submit(self.msg_parser.parse_msg_tail, msg_file, tail)
+                       for _, msg_file, _, _, tail in to_parse]
+        else:
+            futures = None
+        
+        for i, (job_info, msg_file, msg_stat, out_key, tail) in enumerate(to_parse):
+            try:
+                if futures is not None:
+                    msg_data, tail = futures[i].result()
+                else:
+                    msg_data, tail = self.msg_parser.parse_msg_tail(msg_file, tail)
+                if msg_data['status'] in TERMINAL_STATUSES:
+                    tail = None  # Finished: no more appends to follow
+                msg_cache[msg_file] = (msg_stat.st_mtime_ns, msg_stat.st_size, out_key, msg_data, tail)
+                self._apply_msg_data(job_info, msg_data)
+            except Exception as e:
+                job_info['status'] = 'error'
+                job_info['error'] = str(e)
+        
+        self._jobs = jobs
+        self._msg_cache = msg_cache
+        return list(jobs.values())
+    
+    @staticmethod
+    def _apply_msg_data(job_info: Dict, msg_data: Dict):
+        """Copy the status fields of parsed .msg data into a job record"""
+        job_info.update({
+            'status': msg_data['status'],
+            'return_code': msg_data.get('return_code'),
+            'runtime_seconds': msg_data.get('run_time_seconds'),
+            'start_time': msg_data.get('job_started'),
+            'finish_time': msg_data.get('finish_time'),
+            'last_update': msg_data.get('last_update')
+        })
         
     def load_element_mapping(self) -> Optional[Dict]:
-        """Load element mapping from JSON file if available"""
+        """
+        Load element mapping from JSON file if available.
+        
+        Also precomputes the per-file assembly/element-number lookups and the
+        assembly count used on every refresh.
+        """
         mapping_file = self.directory / "element_mapping.json"
-        if mapping_file.exists():
-            try:
+        try:
+            if orjson is not None:
+                mapping = orjson.loads(mapping_file.read_bytes())
+            else:
                 with open(mapping_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load element mapping: {e}")
+                    mapping = json.load(f)
+            self._filename_to_assembly = {name: info['assembly'] for name, info in mapping.items()}
+            self._filename_to_element_number = {name: info['element_number'] for name, info in mapping.items()}
+            self._assembly_count = len(set(self._filename_to_assembly.values()))
+            return mapping
+        except FileNotFoundError:
+            pass  # No mapping file (assembly-based jobs)
+        except Exception as e:
+            print(f"Warning: Could not load element mapping: {e}")
         return None
         
     def group_jobs_by_assembly(self, job_data: List[Dict]) -> Dict[str, List[Dict]]:
@@ -83,10 +325,10 @@ class ScaleJobMonitor:
         groups = defaultdict(list)
         ungrouped = []
         
+        filename_to_assembly = self._filename_to_assembly
         for job in job_data:
-            job_filename = job['inp_file'].name
-            if job_filename in self.element_mapping:
-                assembly = self.element_mapping[job_filename]['assembly']
+            assembly = filename_to_assembly.get(job['inp_file'].name)
+            if assembly is not None:
                 groups[assembly].append(job)
             else:
                 ungrouped.append(job)
@@ -97,52 +339,6 @@ class ScaleJobMonitor:
             
         return dict(groups)
     
-    def get_job_status_data(self, inp_files: List[Path]) -> List[Dict]:
-        """Get status data for all jobs"""
-        job_data = []
-        
-        for inp_file in inp_files:
-            msg_file = inp_file.with_suffix('.msg')
-            out_file = inp_file.with_suffix('.out')
-            
-            job_info = {
-                'name': inp_file.stem,
-                'inp_file': inp_file,
-                'msg_file': msg_file,
-                'out_file': out_file,
-                'status': 'not_started',
-                'return_code': None,
-                'runtime_seconds': None,
-                'start_time': None,
-                'finish_time': None,
-                'last_update': None,
-                'file_sizes': {
-                    'inp': inp_file.stat().st_size if inp_file.exists() else 0,
-                    'msg': msg_file.stat().st_size if msg_file.exists() else 0,
-                    'out': out_file.stat().st_size if out_file.exists() else 0
-                }
-            }
-            
-            # Parse .msg file if it exists
-            if msg_file.exists():
-                try:
-                    msg_data = self.msg_parser.parse_msg_file(msg_file)
-                    job_info.update({
-                        'status': msg_data['status'],
-                        'return_code': msg_data.get('return_code'),
-                        'runtime_seconds': msg_data.get('run_time_seconds'),
-                        'start_time': msg_data.get('job_started'),
-                        'finish_time': msg_data.get('finish_time'),
-                        'last_update': msg_data.get('last_update')
-                    })
-                except Exception as e:
-                    job_info['status'] = 'error'
-                    job_info['error'] = str(e)
-            
-            job_data.append(job_info)
-        
-        return job_data
-    
     def get_summary_stats(self, job_data: List[Dict]) -> Dict:
         """Calculate summary statistics"""
         stats = {
@@ -157,23 +353,15 @@ class ScaleJobMonitor:
             'estimated_remaining': None
         }
         
-        completed_runtimes = []
-        running_jobs = 0
+        stats.update(Counter(job['status'] for job in job_data))
+        running_jobs = stats['running']
         
-        for job in job_data:
-            status = job['status']
-            stats[status] = stats.get(status, 0) + 1
-            
-            if job['runtime_seconds']:
-                completed_runtimes.append(job['runtime_seconds'])
-                stats['total_runtime'] += job['runtime_seconds']
-            
-            if status == 'running':
-                running_jobs += 1
+        completed_runtimes = [runtime for runtime in (job['runtime_seconds'] for job in job_data) if runtime]
         
         # Calculate averages and estimates
         if completed_runtimes:
-            stats['avg_runtime'] = sum(completed_runtimes) / len(completed_runtimes)
+            stats['total_runtime'] = sum(completed_runtimes)
+            stats['avg_runtime'] = stats['total_runtime'] / len(completed_runtimes)
             
             # Estimate remaining time when there are any incomplete jobs
             if running_jobs > 0 or stats['not_started'] > 0:
@@ -195,33 +383,9 @@ class ScaleJobMonitor:
             'error': 0
         }
         
-        for job in assembly_jobs:
-            status = job['status']
-            stats[status] = stats.get(status, 0) + 1
-            
+        stats.update(Counter(job['status'] for job in assembly_jobs))
         return stats
     
-    def format_time(self, seconds: Optional[float]) -> str:
-        """Format time duration"""
-        if seconds is None:
-            return "N/A"
-        
-        if seconds < 60:
-            return f"{seconds:.0f}s"
-        elif seconds < 3600:
-            return f"{seconds/60:.1f}m"
-        else:
-            return f"{seconds/3600:.1f}h"
-    
-    def format_size(self, bytes_size: int) -> str:
-        """Format file size"""
-        if bytes_size < 1024:
-            return f"{bytes_size}B"
-        elif bytes_size < 1024*1024:
-            return f"{bytes_size/1024:.1f}KB"
-        else:
-            return f"{bytes_size/(1024*1024):.1f}MB"
-    
     def get_status_color(self, status: str) -> str:
         """Get color code for status"""
         colors = {
@@ -235,6 +399,16 @@ class ScaleJobMonitor:
     
     def get_status_symbol(self, status: str) -> str:
         """Get symbol for status"""
+        if self._ascii_mode:
+            symbols = {
+                'not_started': '.',
+                'running': '*',
+                'completed': '+',
+                'failed': 'x',
+                'error': '!'
+            }
+            return symbols.get(status, '?')
+        
         symbols = {
             'not_started': '⏳',
             'running': '🔄',
@@ -244,124 +418,166 @@ class ScaleJobMonitor:
         }
         return symbols.get(status, '❓')
     
+    def _status_templates(self, status: str) -> Tuple[str, str]:
+        """Get the (job list row, grouped element row) format templates for a status"""
+        templates = self._row_templates.get(status)
+        if templates is None:
+            prefix = f"{self.get_status_color(status)}{self.get_status_symbol(status)}"
+            end = self.COLORS['END']
+            templates = (
+                f"{prefix} {status:<6}{end} {{name:<25}} {{runtime:<10}} {{return_code:<6}} {{files:<15}}",
+                f"    {prefix}{end} {{element:<6}} {status:<12} {{runtime:<8}} RC:{{return_code}}"
+            )
+            self._row_templates[status] = templates
+        return templates
+    
     def display_status(self, job_data: List[Dict], stats: Dict, show_grouped: bool = False):
         """Display the status dashboard"""
-        print(self.CLEAR_SCREEN, end='')
+        # Build the whole frame, then write it at once
+        C = self.COLORS
+        BOLD, END = C['BOLD'], C['END']
+        GREEN, RED, YELLOW, WHITE = C['GREEN'], C['RED'], C['YELLOW'], C['WHITE']
+        lines = []
         
-        # Header
-        print(f"{self.COLORS['BOLD']}{self.COLORS['CYAN']}SCALE Parallel Job Monitor{self.COLORS['END']}")
-        print(f"{self.COLORS['BLUE']}Directory: {self.directory}{self.COLORS['END']}")
-        print(f"Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        # Header ("Last update" line is inserted once we know the frame will be written)
+        lines.append(f"{self.CLEAR_SCREEN}{BOLD}{C['CYAN']}SCALE Parallel Job Monitor{END}")
+        lines.append(f"{C['BLUE']}Directory: {self.directory}{END}")
         
         # Show element mapping status
         if self.element_mapping:
-            total_assemblies = len(set(info['assembly'] for info in self.element_mapping.values()))
-            print(f"{self.COLORS['CYAN']}Element mode: {len(self.element_mapping)} elements from {total_assemblies} assemblies{self.COLORS['END']}")
+            lines.append(f"{C['CYAN']}Element mode: {len(self.element_mapping)} elements from {self._assembly_count} assemblies{END}")
         
-        print("=" * 80)
+        lines.append("=" * 80)
         
         # Summary stats
-        print(f"\n{self.COLORS['BOLD']}SUMMARY{self.COLORS['END']}")
+        lines.append(f"\n{BOLD}SUMMARY{END}")
         total = stats['total']
-        print(f"Total Jobs: {total}")
-        print(f"Not Started: {self.COLORS['WHITE']}{stats['not_started']}{self.COLORS['END']} | "
-              f"Running: {self.COLORS['YELLOW']}{stats['running']}{self.COLORS['END']} | "
-              f"Completed: {self.COLORS['GREEN']}{stats['completed']}{self.COLORS['END']} | "
-              f"Failed: {self.COLORS['RED']}{stats['failed']}{self.COLORS['END']} | "
-              f"Error: {self.COLORS['MAGENTA']}{stats['error']}{self.COLORS['END']}")
+        lines.append(f"Total Jobs: {total}")
+        lines.append(f"Not Started: {WHITE}{stats['not_started']}{END} | "
+                     f"Running: {YELLOW}{stats['running']}{END} | "
+                     f"Completed: {GREEN}{stats['completed']}{END} | "
+                     f"Failed: {RED}{stats['failed']}{END} | "
+                     f"Error: {C['MAGENTA']}{stats['error']}{END}")
         
         if total > 0:
             progress = (stats['completed'] + stats['failed']) / total * 100
-            print(f"Progress: {progress:.1f}% ({stats['completed'] + stats['failed']}/{total})")
+            lines.append(f"Progress: {progress:.1f}% ({stats['completed'] + stats['failed']}/{total})")
         
         if stats['avg_runtime'] > 0:
-            print(f"Average Runtime: {self.format_time(stats['avg_runtime'])}")
+            lines.append(f"Average Runtime: {format_time(stats['avg_runtime'])}")
             
         if stats['estimated_remaining']:
-            print(f"Estimated Remaining: {self.format_time(stats['estimated_remaining'])}")
+            lines.append(f"Estimated Remaining: {format_time(stats['estimated_remaining'])}")
         
         # Display jobs grouped by assembly if element mapping is available
         if show_grouped and self.element_mapping:
-            self.display_grouped_status(job_data)
+            lines.extend(self._grouped_status_lines(job_data))
         else:
-            self.display_job_list(job_data)
+            lines.extend(self._job_list_lines(job_data))
         
         # Instructions
-        print("\n" + "=" * 80)
-        print("Press Ctrl+C to exit monitoring")
+        lines.append("\n" + "=" * 80)
+        lines.append("Press Ctrl+C to exit monitoring")
         if self.element_mapping:
-            print("Use --grouped to show assembly groupings")
+            lines.append("Use --grouped to show assembly groupings")
         
         if stats['running'] == 0 and stats['not_started'] == 0:
-            print(f"\n{self.COLORS['BOLD']}{self.COLORS['GREEN']}All jobs completed!{self.COLORS['END']}")
+            lines.append(f"\n{BOLD}{GREEN}All jobs completed!{END}")
+        
+        # Skip redrawing an unchanged frame, except for a periodic timestamp refresh
+        frame_hash = hash(tuple(lines))
+        now = time.monotonic()
+        if frame_hash == self._last_frame_hash and now - self._last_frame_time < HEARTBEAT_SECONDS:
+            return
+        self._last_frame_hash = frame_hash
+        self._last_frame_time = now
+        
+        lines.insert(2, f"Last update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._write_lines(lines)
+    
+    def _write_lines(self, lines: List[str]):
+        """Write lines to stdout with a single write and flush"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
             
     def display_grouped_status(self, job_data: List[Dict]):
         """Display jobs grouped by assembly"""
+        self._write_lines(self._grouped_status_lines(job_data))
+    
+    def _grouped_status_lines(self, job_data: List[Dict]) -> List[str]:
+        """Build the output lines for jobs grouped by assembly"""
+        C = self.COLORS
+        BOLD, END = C['BOLD'], C['END']
+        GREEN, RED, YELLOW, WHITE = C['GREEN'], C['RED'], C['YELLOW'], C['WHITE']
+        status_templates = self._status_templates
+        element_numbers = self._filename_to_element_number
         grouped_jobs = self.group_jobs_by_assembly(job_data)
         
-        print(f"\n{self.COLORS['BOLD']}JOBS BY ASSEMBLY{self.COLORS['END']}")
+        lines = [f"\n{BOLD}JOBS BY ASSEMBLY{END}"]
         
         for assembly_name, assembly_jobs in grouped_jobs.items():
             assembly_stats = self.get_assembly_stats(assembly_jobs)
             
             # Assembly header with stats
-            print(f"\n{self.COLORS['BOLD']}{self.COLORS['BLUE']}{assembly_name}{self.COLORS['END']} "
-                  f"({assembly_stats['total']} elements)")
-            print(f"  Status: {self.COLORS['GREEN']}{assembly_stats['completed']}{self.COLORS['END']} completed, "
-                  f"{self.COLORS['YELLOW']}{assembly_stats['running']}{self.COLORS['END']} running, "
-                  f"{self.COLORS['WHITE']}{assembly_stats['not_started']}{self.COLORS['END']} pending, "
-                  f"{self.COLORS['RED']}{assembly_stats['failed']}{self.COLORS['END']} failed")
+            lines.append(f"\n{BOLD}{C['BLUE']}{assembly_name}{END} "
+                         f"({assembly_stats['total']} elements)")
+            lines.append(f"  Status: {GREEN}{assembly_stats['completed']}{END} completed, "
+                         f"{YELLOW}{assembly_stats['running']}{END} running, "
+                         f"{WHITE}{assembly_stats['not_started']}{END} pending, "
+                         f"{RED}{assembly_stats['failed']}{END} failed")
             
             # Element details for this assembly
             for job in assembly_jobs[:10]:  # Show first 10 elements
-                status = job['status']
-                color = self.get_status_color(status)
-                symbol = self.get_status_symbol(status)
-                
                 # Get element info from mapping
                 element_info = ""
-                job_filename = job['inp_file'].name
-                if job_filename in self.element_mapping:
-                    element_key = self.element_mapping[job_filename]['element_key']
-                    element_number = self.element_mapping[job_filename]['element_number']
+                element_number = element_numbers.get(job['inp_file'].name)
+                if element_number is not None:
                     element_info = f"E{element_number:03d}"
                 
-                runtime = self.format_time(job['runtime_seconds'])
+                runtime = format_time(job['runtime_seconds'])
                 return_code = str(job['return_code']) if job['return_code'] is not None else "-"
                 
-                print(f"    {color}{symbol}{self.COLORS['END']} {element_info:<6} "
-                      f"{status:<12} {runtime:<8} RC:{return_code}")
+                lines.append(status_templates(job['status'])[1].format(
+                    element=element_info, runtime=runtime, return_code=return_code))
             
             # Show summary if more than 10 elements
             if len(assembly_jobs) > 10:
                 remaining = len(assembly_jobs) - 10
-                print(f"    ... and {remaining} more elements")
+                lines.append(f"    ... and {remaining} more elements")
+        
+        return lines
                 
     def display_job_list(self, job_data: List[Dict]):
         """Display simple job list (original format)"""
-        print(f"\n{self.COLORS['BOLD']}JOB STATUS{self.COLORS['END']}")
-        print(f"{'Status':<8} {'Job Name':<25} {'Runtime':<10} {'Return':<6} {'Files':<15}")
-        print("-" * 80)
+        self._write_lines(self._job_list_lines(job_data))
+    
+    def _job_list_lines(self, job_data: List[Dict]) -> List[str]:
+        """Build the output lines for the simple job list"""
+        BOLD, END = self.COLORS['BOLD'], self.COLORS['END']
+        status_templates = self._status_templates
+        lines = [
+            f"\n{BOLD}JOB STATUS{END}",
+            f"{'Status':<8} {'Job Name':<25} {'Runtime':<10} {'Return':<6} {'Files':<15}",
+            "-" * 80
+        ]
         
         for job in job_data:
-            status = job['status']
-            color = self.get_status_color(status)
-            symbol = self.get_status_symbol(status)
-            
             job_name = job['name']
             if len(job_name) > 25:
                 job_name = job_name[:22] + "..."
             
-            runtime = self.format_time(job['runtime_seconds'])
+            runtime = format_time(job['runtime_seconds'])
             return_code = str(job['return_code']) if job['return_code'] is not None else "-"
             
             # File sizes
-            msg_size = self.format_size(job['file_sizes']['msg'])
-            out_size = self.format_size(job['file_sizes']['out'])
+            msg_size = format_size(job['file_sizes']['msg'])
+            out_size = format_size(job['file_sizes']['out'])
             files = f"{msg_size}/{out_size}"
             
-            print(f"{color}{symbol} {status:<6}{self.COLORS['END']} "
-                  f"{job_name:<25} {runtime:<10} {return_code:<6} {files:<15}")
+            lines.append(status_templates(job['status'])[0].format(
+                name=job_name, runtime=runtime, return_code=return_code, files=files))
+        
+        return lines
     
     def run_monitor(self, pattern: str = "assembly_*.inp", show_grouped: bool = False):
         """Run the monitoring loop"""
@@ -379,18 +595,20 @@ class ScaleJobMonitor:
         
         print("Press Ctrl+C to exit\n")
         
+        changes, observer = self._start_watching()
+        changed_stems = None  # Refresh every job on the first pass
+        
         try:
             while not self.stop_monitoring:
-                # Find jobs
-                inp_files = self.find_jobs(pattern)
+                # Find jobs and get status data
+                job_data = self._scan_jobs(pattern, changed_stems)
                 
-                if not inp_files:
+                if not job_data:
                     print(f"No jobs found matching pattern '{pattern}' in {self.directory}")
-                    time.sleep(self.refresh_interval)
+                    self._last_frame_hash = None  # Redraw once jobs appear
+                    changed_stems = self._wait_for_changes(changes)
                     continue
                 
-                # Get status data
-                job_data = self.get_job_status_data(inp_files)
                 stats = self.get_summary_stats(job_data)
                 
                 # Display status
@@ -401,12 +619,53 @@ class ScaleJobMonitor:
                     print(f"\n{self.COLORS['BOLD']}Monitoring complete - all jobs finished{self.COLORS['END']}")
                     break
                 
-                time.sleep(self.refresh_interval)
+                changed_stems = self._wait_for_changes(changes)
                 
         except KeyboardInterrupt:
             print(f"\n{self.COLORS['YELLOW']}Monitoring stopped by user{self.COLORS['END']}")
         except Exception as e:
             print(f"\n{self.COLORS['RED']}Error during monitoring: {e}{self.COLORS['END']}")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+    
+    def _start_watching(self):
+        """
+        Start a watchdog observer on the job directory if watchdog is installed.
+        
+        Returns:
+            (DirectoryChanges, observer), or (None, None) when falling back to polling
+        """
+        if Observer is None:
+            return None, None
+        
+        changes = DirectoryChanges()
+        observer = Observer()
+        try:
+            observer.schedule(changes, str(self.directory), recursive=False)
+            observer.start()
+        except OSError as e:
+            # E.g. inotify watch limit reached or unsupported filesystem
+            print(f"Warning: Could not watch {self.directory} for changes ({e}); polling instead")
+            return None, None
+        return changes, observer
+    
+    def _wait_for_changes(self, changes: Optional[DirectoryChanges]) -> Optional[Set[str]]:
+        """
+        Wait before the next refresh: at least refresh_interval, then until something changes.
+        
+        Returns:
+            Job names to refresh, or None to refresh every job (polling or heartbeat)
+        """
+        time.sleep(self.refresh_interval)
+        if changes is None:
+            return None
+        # Returns at once if files changed during the sleep
+        return changes.wait(max(0, HEARTBEAT_SECONDS - self.refresh_interval))
     
     def stop(self):
         """Stop the monitoring loop"""
@@ -442,6 +701,8 @@ def main():
                        help="Show element jobs grouped by assembly (requires element_mapping.json)")
     parser.add_argument("--element-mode", "-e", action="store_true",
                        help="Automatically use element_*.inp pattern and enable grouping")
+    parser.add_argument("--ascii", action="store_true",
+                       help="Use ASCII status symbols instead of emoji (also enabled by setting SCALE_MONITOR_ASCII)")
     
     args = parser.parse_args()
     
@@ -455,14 +716,14 @@ def main():
         print("Element mode enabled: using pattern 'element_*.inp' with assembly grouping")
     
     # Create monitor
-    monitor = ScaleJobMonitor(Path(args.directory), args.refresh)
+    ascii_mode = args.ascii or bool(os.environ.get('SCALE_MONITOR_ASCII'))
+    monitor = ScaleJobMonitor(Path(args.directory), args.refresh, ascii_mode)
     
     if args.once:
         # Single status check
         monitor.element_mapping = monitor.load_element_mapping()
-        inp_files = monitor.find_jobs(pattern)
-        if inp_files:
-            job_data = monitor.get_job_status_data(inp_files)
+        job_data = monitor._scan_jobs(pattern)
+        if job_data:
             stats = monitor.get_summary_stats(job_data)
             monitor.display_status(job_data, stats, show_grouped)
         else:
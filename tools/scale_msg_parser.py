@@ -6,10 +6,13 @@ This module provides utilities for parsing SCALE .msg files to determine
 job status, completion, and execution details.
 """
 
+import os
 import re
+import io
+import codecs
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Set, Tuple, Union
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -32,20 +35,128 @@ class ScaleMsgParser:
             'finish_time': r'finished at\s+(.+)',
             'executing': r'Now executing\s+(\S+)'
         }
+        # Result keys for patterns whose key differs, and patterns with integer values
+        self.result_keys = {'run_time': 'run_time_seconds'}
+        self.int_fields = {'process_id', 'return_code', 'run_time'}
     
-    def parse_msg_file(self, msg_path: Union[str, Path]) -> Dict:
+    def parse_msg_file(self, msg_path: Union[str, Path], stat: Optional[os.stat_result] = None) -> Dict:
         """
         Parse a SCALE .msg file for complete job information
         
         Args:
             msg_path: Path to the .msg file
+            stat: os.stat() result for msg_path if the caller already has one
             
         Returns:
             Dictionary containing job status information
         """
         msg_path = Path(msg_path)
+        result = self._new_result(msg_path)
         
-        result = {
+        # One stat both checks existence and gives the modification time
+        if stat is None:
+            try:
+                stat = msg_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                result['status'] = 'not_started'
+                return result
+        
+        try:
+            # Get file modification time
+            result['last_update'] = datetime.fromtimestamp(stat.st_mtime)
+            
+            with open(msg_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            
+            return self._parse_content(result, content)
+            
+        except Exception as e:
+            logger.error(f"Error parsing {msg_path}: {e}")
+            result['status'] = 'error'
+            result['error'] = str(e)
+            return result
+    
+    def parse_msg_tail(self, msg_path: Union[str, Path], state: Optional[Dict] = None) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Parse a .msg file that is still being appended to, reading and parsing
+        only the bytes added since the previous call for the same file
+        
+        The state keeps the fields parsed so far, not the file text. As in
+        parse_msg_file, the first match of each pattern wins, so a field never
+        changes once set.
+        
+        Args:
+            msg_path: Path to the .msg file
+            state: State returned by the previous call for this file, or None
+                to read from the beginning
+            
+        Returns:
+            Tuple of (job status information as from parse_msg_file, state for the next call)
+        """
+        msg_path = Path(msg_path)
+        result = self._new_result(msg_path)
+        
+        try:
+            stat = msg_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            result['status'] = 'not_started'
+            return result, None
+        
+        try:
+            result['last_update'] = datetime.fromtimestamp(stat.st_mtime)
+            
+            # Start over when there is no state or the file was truncated/rewritten
+            if state is None or stat.st_size < state['offset']:
+                # Same decoding as reading in text mode with errors='ignore'
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+                state = {
+                    'offset': 0,
+                    'decoder': io.IncrementalNewlineDecoder(decoder, translate=True),
+                    'partial': '',  # Unfinished last line, parsed again once complete
+                    'fields': {},
+                    'executing_modules': [],
+                    'errors_checked': set(),
+                    'error_found': False
+                }
+            
+            with open(msg_path, 'rb') as f:
+                f.seek(state['offset'])
+                data = f.read()
+            state['offset'] += len(data)
+            text = state['partial'] + state['decoder'].decode(data)
+            line_end = text.rfind('\n') + 1
+            complete, state['partial'] = text[:line_end], text[line_end:]
+            
+            if complete:
+                self._merge_fields(state['fields'], self._match_fields(complete))
+                state['executing_modules'].extend(re.findall(self.patterns['executing'], complete, re.IGNORECASE))
+                if not state['error_found']:
+                    state['error_found'] = self._find_error_indicator(complete.lower(), state['errors_checked'])
+            
+            fields = dict(state['fields'])
+            executing_modules = list(state['executing_modules'])
+            error_found = state['error_found']
+            if state['partial']:
+                partial = state['partial']
+                self._merge_fields(fields, self._match_fields(partial))
+                executing_modules.extend(re.findall(self.patterns['executing'], partial, re.IGNORECASE))
+                if not error_found:
+                    error_found = self._find_error_indicator(partial.lower(), set(state['errors_checked']))
+            
+            result.update(fields)
+            result['executing_modules'] = executing_modules
+            result['status'] = self._determine_status(result, error_found=error_found)
+            return result, state
+            
+        except Exception as e:
+            logger.error(f"Error parsing {msg_path}: {e}")
+            result['status'] = 'error'
+            result['error'] = str(e)
+            return result, None
+    
+    def _new_result(self, msg_path: Path) -> Dict:
+        """Create an empty result dictionary for a .msg file"""
+        return {
             'msg_file': str(msg_path),
             'status': 'unknown',
             'job_started': None,
@@ -60,65 +171,63 @@ class ScaleMsgParser:
             'executing_modules': [],
             'last_update': None
         }
+    
+    def _parse_content(self, result: Dict, content: str) -> Dict:
+        """
+        Fill in a result dictionary from the text of a .msg file
         
-        if not msg_path.exists():
-            result['status'] = 'not_started'
-            return result
-        
-        try:
-            # Get file modification time
-            result['last_update'] = datetime.fromtimestamp(msg_path.stat().st_mtime)
-            
-            with open(msg_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Parse all patterns
-            for key, pattern in self.patterns.items():
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    if key == 'job_started':
-                        result['job_started'] = match.group(1).strip()
-                    elif key == 'host_name':
-                        result['host_name'] = match.group(1).strip()
-                    elif key == 'process_id':
-                        result['process_id'] = int(match.group(1))
-                    elif key == 'input_file':
-                        result['input_file'] = match.group(1).strip()
-                    elif key == 'output_file':
-                        result['output_file'] = match.group(1).strip()
-                    elif key == 'job_finished':
-                        result['job_finished'] = match.group(1).strip()
-                    elif key == 'output_stored':
-                        result['output_stored'] = match.group(1).strip()
-                    elif key == 'return_code':
-                        result['return_code'] = int(match.group(1))
-                    elif key == 'run_time':
-                        result['run_time_seconds'] = int(match.group(1))
-                    elif key == 'finish_time':
-                        result['finish_time'] = match.group(1).strip()
-            
-            # Find all executing modules
-            executing_matches = re.findall(self.patterns['executing'], content, re.IGNORECASE)
-            result['executing_modules'] = executing_matches
-            
-            # Determine job status
-            result['status'] = self._determine_status(result, content)
+        Args:
+            result: Dictionary from _new_result (with last_update set)
+            content: Full text of the .msg file
             
-            return result
+        Returns:
+            The updated result dictionary
+        """
+        result.update(self._match_fields(content))
+        
+        # Find all executing modules
+        executing_matches = re.findall(self.patterns['executing'], content, re.IGNORECASE)
+        result['executing_modules'] = executing_matches
+        
+        # Determine job status
+        result['status'] = self._determine_status(result, content)
+        
+        return result
+    
+    def _match_fields(self, content: str) -> Dict:
+        """
+        Extract the fields matched by the patterns in a piece of .msg text
+        
+        Args:
+            content: Text of the .msg file, or the part of it read last
             
-        except Exception as e:
-            logger.error(f"Error parsing {msg_path}: {e}")
-            result['status'] = 'error'
-            result['error'] = str(e)
-            return result
+        Returns:
+            Dictionary of result keys to values, for the patterns that matched
+        """
+        fields = {}
+        for key, pattern in self.patterns.items():
+            if key == 'executing':
+                continue
+            match = re.search(pattern, content, re.IGNORECASE)
+            if match:
+                value = match.group(1)
+                fields[self.result_keys.get(key, key)] = int(value) if key in self.int_fields else value.strip()
+        return fields
+    
+    @staticmethod
+    def _merge_fields(fields: Dict, new_fields: Dict):
+        """Merge newly matched fields, keeping values already set (the first match wins)"""
+        for key, value in new_fields.items():
+            fields.setdefault(key, value)
     
-    def _determine_status(self, parsed_data: Dict, content: str) -> str:
+    def _determine_status(self, parsed_data: Dict, content: Optional[str] = None, error_found: bool = False) -> str:
         """
         Determine job status based on parsed data and content
         
         Args:
             parsed_data: Dictionary of parsed message data
-            content: Raw content of the .msg file
+            content: Raw content of the .msg file, scanned for error indicators
+            error_found: Whether an error indicator was already found (used when content is None)
             
         Returns:
             Status string: 'not_started', 'running', 'completed', 'failed', 'error'
@@ -141,7 +250,30 @@ class ScaleMsgParser:
         if parsed_data.get('job_finished'):
             return 'completed'
         
-        # Check for error indicators using word boundary matching to avoid false positives
+        # Check for error indicators
+        if content is not None:
+            error_found = self._find_error_indicator(content.lower(), set())
+        if error_found:
+            return 'failed'
+        
+        # Check if job has started
+        if parsed_data.get('job_started'):
+            return 'running'
+        
+        return 'not_started'
+    
+    def _find_error_indicator(self, content_lower: str, checked: Set[int]) -> bool:
+        """
+        Check the first occurrence of each error indicator in lower-cased .msg text
+        
+        Args:
+            content_lower: Lower-cased .msg text
+            checked: Indices of error patterns whose first occurrence was already
+                checked; updated with the patterns found here
+            
+        Returns:
+            True if an error indicator was found outside a benign context
+        """
         # Use regex patterns to match whole words only, excluding benign contexts
         error_patterns = [
             r'\berror\b(?!\s+(?:tolerance|bound|estimate|bar|margin|limit|threshold|norm))',  # 'error' but not 'error tolerance', etc.
@@ -163,11 +295,12 @@ class ScaleMsgParser:
             r'error\s*[=<>:]',  # error = 0.001, error < 1e-5, etc.
         ]
 
-        content_lower = content.lower()
-
-        for pattern in error_patterns:
+        for i, pattern in enumerate(error_patterns):
+            if i in checked:
+                continue
             match = re.search(pattern, content_lower)
             if match:
+                checked.add(i)
                 matched_text = match.group(0)
                 # Check if this match is part of a benign context
                 is_benign = False
@@ -182,13 +315,9 @@ class ScaleMsgParser:
 
                 if not is_benign:
                     logger.debug(f"Found error indicator '{matched_text}' in msg file")
-                    return 'failed'
+                    return True
         
-        # Check if job has started
-        if parsed_data.get('job_started'):
-            return 'running'
-        
-        return 'not_started'
+        return False
     
     def _check_scale_output_status(self, output_file_path: str) -> Optional[str]:
         """
@@ -202,11 +331,13 @@ class ScaleMsgParser:
         """
         try:
             output_path = Path(output_file_path)
-            if not output_path.exists():
-                return None
             
             # Read the last part of the file to find the summary section
-            with open(output_path, 'r', encoding='utf-8', errors='ignore') as f:
+            try:
+                f = open(output_path, 'r', encoding='utf-8', errors='ignore')
+            except (FileNotFoundError, NotADirectoryError):
+                return None
+            with f:
                 # Read last 50KB to capture the summary section
                 f.seek(0, 2)  # Go to end
                 file_size = f.tell()